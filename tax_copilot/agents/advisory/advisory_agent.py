@@ -2,20 +2,59 @@
 
 import asyncio
 import json
+import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from tax_copilot.core.models import TaxProfile
-from tax_copilot.agents.providers.base import LLMProvider, Message
+import aiofiles
+
+from tax_copilot.core.models import TaxProfile, Money
+from tax_copilot.agents.providers.base import LLMProvider, Message, track_usage
+from tax_copilot.agents.cache import LLMCache, make_cache_key, profile_fingerprint
 from tax_copilot.agents.storage.profile_builder import ProfileBuilder
-from tax_copilot.agents.utils import parse_json_response
-from .models import AdvisoryReport
+from tax_copilot.agents.utils import as_float, parse_json_response
+from .models import (
+    AdvisoryReport,
+    DeductionFinderReport,
+    OptimizationReport,
+    TaxCalculation,
+)
 from .tax_calculator import TaxCalculator
 from .optimization_agent import OptimizationAgent
 from .deduction_finder import DeductionFinder
 from .report_generator import ReportGenerator
-from .prompts import get_executive_summary_prompt
+from .prompts import (
+    CALCULATION_PROMPT_FIELDS,
+    COMBINED_ANALYSIS_SCHEMA,
+    get_combined_analysis_prompt,
+    get_executive_summary_preamble_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sidecar file in the reports directory holding the list_reports summaries
+REPORT_INDEX_FILE = "index.json"
+
+# Threads used to read reports when rebuilding the index
+REPORT_INDEX_WORKERS = 8
+
+# How long list_profiles results are reused before re-reading the directory
+PROFILE_CACHE_TTL_SECONDS = 60
+
+# AdvisoryReport fields read by _summarize_report
+REPORT_SUMMARY_FIELDS = {
+    "report_id": True,
+    "user_id": True,
+    "tax_year": True,
+    "generated_at": True,
+    "tax_calculation": {"total_tax"},
+    "optimization_report": {"total_potential_savings"},
+    "deduction_finder_report": {"total_potential_savings"},
+}
 
 
 class AdvisoryAgent:
@@ -29,19 +68,24 @@ class AdvisoryAgent:
     - ReportGenerator: Creates advisory reports
     """
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, cache: LLMCache | None = None):
         """
         Initialize the advisory agent.
 
         Args:
             llm_provider: LLM provider for all agents
+            cache: Cache for analysis responses. If None, uses a cache
+                   persisted in ~/.tax_copilot/cache
         """
         self.llm = llm_provider
-        self.tax_calculator = TaxCalculator(llm_provider)
-        self.optimization_agent = OptimizationAgent(llm_provider)
-        self.deduction_finder = DeductionFinder(llm_provider)
+        self._report_index_lock = asyncio.Lock()
+        self.cache = cache or LLMCache(Path.home() / ".tax_copilot" / "cache")
+        self.tax_calculator = TaxCalculator(llm_provider, self.cache)
+        self.optimization_agent = OptimizationAgent(llm_provider, self.cache)
+        self.deduction_finder = DeductionFinder(llm_provider, self.cache)
         self.report_generator = ReportGenerator()
         self.profile_builder = ProfileBuilder()
+        self._profile_cache: dict[str | None, tuple[float, list[TaxProfile]]] = {}
 
     async def analyze_profile(
         self,
@@ -60,58 +104,50 @@ class AdvisoryAgent:
         """
         start_time = time.time()
 
-        # Step 1: Calculate taxes (parallel federal + state)
-        print(f"Calculating {profile.tax_year} taxes...")
-        calculation = await self.tax_calculator.calculate(profile)
-        print(f"  Federal tax: ${calculation.federal_tax.to_dollars():,.2f}")
-        print(f"  State tax: ${calculation.state_tax.to_dollars():,.2f}")
-        print(f"  Total tax: ${calculation.total_tax.to_dollars():,.2f}")
-        print(f"  Effective rate: {calculation.effective_tax_rate:.1f}%")
-        print()
-
-        # Step 2: Find optimizations and missed deductions (parallel)
-        print("Analyzing optimization strategies and potential deductions...")
-        optimization_task = self.optimization_agent.analyze(profile, calculation)
-        deduction_task = self.deduction_finder.analyze(profile)
-
-        optimization_report, deduction_report = await asyncio.gather(
-            optimization_task, deduction_task, return_exceptions=True
-        )
-
-        # Handle errors
-        if isinstance(optimization_report, Exception):
-            print(f"  Warning: Optimization analysis failed: {optimization_report}")
-            from .models import OptimizationReport
-            from tax_copilot.core.models import Money
-            optimization_report = OptimizationReport(
-                strategies=[],
-                total_potential_savings=Money(cents=0),
-                reasoning="Analysis failed",
-            )
-
-        if isinstance(deduction_report, Exception):
-            print(f"  Warning: Deduction finder failed: {deduction_report}")
-            from .models import DeductionFinderReport
-            from tax_copilot.core.models import Money
-            deduction_report = DeductionFinderReport(
-                missed_deductions=[],
-                total_potential_savings=Money(cents=0),
-                follow_up_questions=[],
-            )
-
-        print(f"  Found {len(optimization_report.strategies)} optimization strategies")
-        print(f"  Found {len(deduction_report.missed_deductions)} potential missed deductions")
-        print()
-
-        # Step 3: Generate executive summary using LLM
-        print("Generating executive summary...")
-        executive_summary, top_recommendations = await self._generate_executive_summary(
-            profile, calculation, optimization_report, deduction_report
-        )
-        print()
+        # Token usage of every LLM call below, including the parallel ones
+        with track_usage() as usage:
+            # The compact profile is built once and shared by every prompt below
+            profile_data = profile.to_prompt_dict()
+
+            # Step 1: Calculate taxes (parallel federal + state)
+            logger.info("Calculating %s taxes...", profile.tax_year)
+            calculation = await self.tax_calculator.calculate(profile, profile_data)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("  Federal tax: $%s", f"{calculation.federal_tax.to_dollars():,.2f}")
+                logger.info("  State tax: $%s", f"{calculation.state_tax.to_dollars():,.2f}")
+                logger.info("  Total tax: $%s", f"{calculation.total_tax.to_dollars():,.2f}")
+                logger.info("  Effective rate: %.1f%%", calculation.effective_tax_rate)
+
+            # Step 2: Find optimizations, missed deductions and executive summary
+            # in a single combined LLM call.
+            logger.info("Analyzing optimization strategies and potential deductions...")
+            combined = await self._run_combined_analysis(profile, calculation, profile_data)
+
+            if combined is not None:
+                (
+                    optimization_report,
+                    deduction_report,
+                    executive_summary,
+                    top_recommendations,
+                ) = combined
+                logger.info(
+                    "  Found %d optimization strategies", len(optimization_report.strategies)
+                )
+                logger.info(
+                    "  Found %d potential missed deductions",
+                    len(deduction_report.missed_deductions),
+                )
+            else:
+                # Step 3 (fallback): Run the per-agent pipeline
+                (
+                    optimization_report,
+                    deduction_report,
+                    executive_summary,
+                    top_recommendations,
+                ) = await self._run_separate_analysis(profile, calculation, profile_data)
 
         # Step 4: Generate final report
-        print("Generating advisory report...")
+        logger.info("Generating advisory report...")
         report = self.report_generator.generate(
             profile=profile,
             calculation=calculation,
@@ -119,53 +155,219 @@ class AdvisoryAgent:
             missed_deductions=deduction_report,
             executive_summary=executive_summary,
             top_recommendations=top_recommendations,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cache_read_tokens=usage.get("cache_read_input_tokens", 0),
+            cache_creation_tokens=usage.get("cache_creation_input_tokens", 0),
         )
 
         # Add metadata
-        report.llm_provider = self.llm.__class__.__name__
+        report.llm_provider = self.llm.provider_name
         report.total_analysis_time_seconds = time.time() - start_time
 
-        print(f"Analysis complete in {report.total_analysis_time_seconds:.1f}s")
-        print()
+        logger.info("Analysis complete in %.1fs", report.total_analysis_time_seconds)
 
         # Step 5: Interactive mode (optional)
         if interactive and deduction_report.follow_up_questions:
-            print("\n=== Interactive Mode ===\n")
-            print("We have some questions to better assess your deductions:")
-            print()
+            logger.info("=== Interactive Mode ===")
+            logger.info("We have some questions to better assess your deductions:")
             # Note: Interactive implementation would go here
             # For now, just list the questions
             for i, question in enumerate(deduction_report.follow_up_questions[:3], 1):
-                print(f"{i}. {question}")
-            print()
-            print("(Interactive mode would allow you to answer these questions)")
-            print()
+                logger.info("%d. %s", i, question)
+            logger.info("(Interactive mode would allow you to answer these questions)")
 
         return report
 
-    async def _generate_executive_summary(
+    async def _run_combined_analysis(
         self,
         profile: TaxProfile,
-        calculation,
-        optimization_report,
-        deduction_report,
-    ) -> tuple[str, list[str]]:
+        calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None = None,
+    ) -> tuple[OptimizationReport, DeductionFinderReport, str, list[str]] | None:
         """
-        Generate executive summary using LLM.
+        Run optimization, deduction finding and executive summary in one LLM call.
 
         Args:
             profile: TaxProfile
             calculation: TaxCalculation
-            optimization_report: OptimizationReport
-            deduction_report: DeductionFinderReport
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
-            Tuple of (executive_summary, top_recommendations)
+            Tuple of (optimization_report, deduction_report, executive_summary,
+            top_recommendations), or None if the combined response is unusable
         """
         try:
-            prompt = get_executive_summary_prompt(
+            key = make_cache_key(
+                "combined_analysis",
+                profile_fingerprint(profile),
+                calculation.model_dump(mode="json", include=CALCULATION_PROMPT_FIELDS),
+            )
+            data = await self.cache.get_or_compute(
+                key, lambda: self._request_combined_analysis(profile, calculation, profile_data)
+            )
+
+            return (
+                self.optimization_agent.build_report(data),
+                self.deduction_finder.build_report(data),
+                data["executive_summary"],
+                data["top_recommendations"],
+            )
+
+        except Exception as e:
+            logger.warning("  Warning: Combined analysis failed, using separate agents: %s", e)
+            return None
+
+    async def _request_combined_analysis(
+        self,
+        profile: TaxProfile,
+        calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Ask the LLM for the combined analysis and validate its shape.
+
+        Args:
+            profile: TaxProfile
+            calculation: TaxCalculation
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Parsed and validated JSON response
+
+        Raises:
+            ValueError: If the response is not valid JSON of the expected shape
+        """
+        prompt = get_combined_analysis_prompt(profile, calculation, profile_data)
+
+        response = await self.llm.generate(
+            messages=[
+                Message(
+                    role="user",
+                    content="Analyze this taxpayer's optimizations, missed deductions and summary.",
+                )
+            ],
+            system_prompt=prompt,
+            response_schema=COMBINED_ANALYSIS_SCHEMA,
+            temperature=0.6,  # Between strategy creativity and deduction accuracy
+            max_tokens=3500,
+        )
+
+        data = parse_json_response(response.content)
+        self._validate_combined_response(data)
+        return data
+
+    def _validate_combined_response(self, data: dict) -> None:
+        """
+        Check that a combined analysis response has the expected shape.
+
+        Args:
+            data: Parsed JSON response
+
+        Raises:
+            ValueError: If a required key is missing or has the wrong type
+        """
+        expected_types = {
+            "strategies": list,
+            "missed_deductions": list,
+            "executive_summary": str,
+            "top_recommendations": list,
+        }
+        for key, expected_type in expected_types.items():
+            if not isinstance(data.get(key), expected_type):
+                raise ValueError(f"Combined response has missing or invalid '{key}'")
+
+    async def _run_separate_analysis(
+        self,
+        profile: TaxProfile,
+        calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None = None,
+    ) -> tuple[OptimizationReport, DeductionFinderReport, str, list[str]]:
+        """
+        Run optimization, deduction finding and executive summary as separate LLM calls.
+
+        Args:
+            profile: TaxProfile
+            calculation: TaxCalculation
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Tuple of (optimization_report, deduction_report, executive_summary,
+            top_recommendations)
+        """
+        optimization_task = self.optimization_agent.analyze(
+            profile, calculation, profile_data
+        )
+        deduction_task = self.deduction_finder.analyze(profile, profile_data)
+        preamble_task = self._generate_executive_preamble(
+            profile, calculation, profile_data
+        )
+
+        # The summary preamble only needs the profile and calculation, so it
+        # runs alongside the other two calls instead of after them
+        optimization_report, deduction_report, preamble = await asyncio.gather(
+            optimization_task, deduction_task, preamble_task, return_exceptions=True
+        )
+
+        # Handle errors
+        if isinstance(optimization_report, Exception):
+            logger.warning("  Warning: Optimization analysis failed: %s", optimization_report)
+            optimization_report = OptimizationReport(
+                strategies=[],
+                total_potential_savings=Money(dollars=0),
+                reasoning="Analysis failed",
+            )
+
+        if isinstance(deduction_report, Exception):
+            logger.warning("  Warning: Deduction finder failed: %s", deduction_report)
+            deduction_report = DeductionFinderReport(
+                missed_deductions=[],
+                total_potential_savings=Money(dollars=0),
+                follow_up_questions=[],
+            )
+
+        logger.info("  Found %d optimization strategies", len(optimization_report.strategies))
+        logger.info(
+            "  Found %d potential missed deductions", len(deduction_report.missed_deductions)
+        )
+
+        # Complete the executive summary with the findings
+        if isinstance(preamble, str) and preamble:
+            executive_summary = self._append_findings(
+                preamble, optimization_report, deduction_report
+            )
+        else:
+            # Use fallback from report generator
+            executive_summary = self.report_generator._build_executive_summary(
                 profile, calculation, optimization_report, deduction_report
             )
+        top_recommendations = self.report_generator._build_top_recommendations(
+            optimization_report, deduction_report
+        )
+
+        return optimization_report, deduction_report, executive_summary, top_recommendations
+
+    async def _generate_executive_preamble(
+        self,
+        profile: TaxProfile,
+        calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Generate the opening paragraphs of the executive summary using LLM.
+
+        Args:
+            profile: TaxProfile
+            calculation: TaxCalculation
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Summary preamble, or an empty string if generation failed
+        """
+        try:
+            prompt = get_executive_summary_preamble_prompt(
+                profile, calculation, profile_data
+            )
 
             response = await self.llm.generate(
                 messages=[
@@ -176,24 +378,54 @@ class AdvisoryAgent:
                 ],
                 system_prompt=prompt,
                 temperature=0.7,
-                max_tokens=1500,
+                max_tokens=800,
             )
 
             data = parse_json_response(response.content)
-            return data.get("executive_summary", ""), data.get("top_recommendations", [])
+            return data.get("executive_summary", "")
 
         except Exception as e:
-            print(f"  Warning: Executive summary generation failed: {e}")
-            # Use fallback from report generator
-            summary = self.report_generator._build_executive_summary(
-                profile, calculation, optimization_report, deduction_report
+            logger.warning("  Warning: Executive summary generation failed: %s", e)
+            return ""
+
+    def _append_findings(
+        self,
+        summary: str,
+        optimization_report: OptimizationReport,
+        deduction_report: DeductionFinderReport,
+    ) -> str:
+        """
+        Append a paragraph describing the analysis findings to a summary preamble.
+
+        Args:
+            summary: Executive summary preamble
+            optimization_report: OptimizationReport
+            deduction_report: DeductionFinderReport
+
+        Returns:
+            Complete executive summary
+        """
+        num_strategies = len(optimization_report.strategies)
+        num_missed = len(deduction_report.missed_deductions)
+
+        if not num_strategies and not num_missed:
+            findings = (
+                "Your tax situation appears well-optimized. We haven't identified "
+                "significant additional tax-saving opportunities at this time."
             )
-            recommendations = self.report_generator._build_top_recommendations(
-                optimization_report, deduction_report
+        else:
+            findings = (
+                f"We identified {num_strategies} optimization strategies with potential "
+                f"savings of ${optimization_report.total_potential_savings.to_dollars():,.2f} "
+                f"and {num_missed} potentially missed deductions worth up to "
+                f"${deduction_report.total_potential_savings.to_dollars():,.2f}. "
+                f"The recommendations below are prioritized by potential impact "
+                f"and ease of implementation."
             )
-            return summary, recommendations
 
-    def save_report(self, report: AdvisoryReport, user_id: str) -> str:
+        return f"{summary.rstrip()}\n\n{findings}"
+
+    async def save_report(self, report: AdvisoryReport, user_id: str) -> str:
         """
         Save advisory report to disk.
 
@@ -204,19 +436,51 @@ class AdvisoryAgent:
         Returns:
             Path to saved report file
         """
+        paths = await self.save_reports([report], user_id)
+        return paths[0]
+
+    async def save_reports(self, reports: list[AdvisoryReport], user_id: str) -> list[str]:
+        """
+        Save several advisory reports to disk concurrently.
+
+        Args:
+            reports: AdvisoryReports to save
+            user_id: User ID
+
+        Returns:
+            Paths to saved report files, in the same order as reports
+        """
         # Create reports directory
         reports_dir = Path.home() / ".tax_copilot" / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save as JSON
-        report_path = reports_dir / f"{report.report_id}.json"
+        paths = await asyncio.gather(
+            *(self._write_report_file(reports_dir, report) for report in reports)
+        )
 
-        with open(report_path, "w") as f:
-            json.dump(report.to_dict(), f, indent=2, default=str)
+        # Keep the listing index in step with the saved reports. The index is
+        # read-modify-write, so concurrent saves take turns updating it.
+        async with self._report_index_lock:
+            await asyncio.to_thread(self._add_to_report_index, reports_dir, reports)
 
-        return str(report_path)
+        return paths
+
+    def save_report_sync(self, report: AdvisoryReport, user_id: str) -> str:
+        """
+        Save advisory report to disk from synchronous code.
+
+        Must not be called while an event loop is running; use save_report there.
 
-    def load_report(self, report_id: str) -> AdvisoryReport:
+        Args:
+            report: AdvisoryReport to save
+            user_id: User ID
+
+        Returns:
+            Path to saved report file
+        """
+        return asyncio.run(self.save_report(report, user_id))
+
+    async def load_report(self, report_id: str) -> AdvisoryReport:
         """
         Load advisory report from disk.
 
@@ -232,13 +496,51 @@ class AdvisoryAgent:
         reports_dir = Path.home() / ".tax_copilot" / "reports"
         report_path = reports_dir / f"{report_id}.json"
 
-        if not report_path.exists():
-            raise FileNotFoundError(f"Report not found: {report_id}")
+        try:
+            async with aiofiles.open(report_path, "rb") as f:
+                content = await f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Report not found: {report_id}") from None
+
+        # Parse and validate in a single pydantic-core pass over the raw bytes
+        return AdvisoryReport.model_validate_json(content)
+
+    async def _write_report_file(self, reports_dir: Path, report: AdvisoryReport) -> str:
+        """
+        Write one report as JSON.
+
+        Args:
+            reports_dir: Reports directory
+            report: AdvisoryReport to write
+
+        Returns:
+            Path to the written file
+        """
+        report_path = reports_dir / f"{report.report_id}.json"
+
+        async with aiofiles.open(report_path, "w") as f:
+            await f.write(report.model_dump_json(indent=2))
+
+        return str(report_path)
+
+    def _add_to_report_index(self, reports_dir: Path, reports: list[AdvisoryReport]) -> None:
+        """
+        Add report summaries to the index, if it exists.
+
+        A missing index is left alone; list_reports rebuilds it from disk.
 
-        with open(report_path, "r") as f:
-            data = json.load(f)
+        Args:
+            reports_dir: Reports directory
+            reports: Saved reports
+        """
+        index = self._read_report_index(reports_dir)
+        if index is None:
+            return
 
-        return AdvisoryReport(**data)
+        for report in reports:
+            summary_data = report.model_dump(mode="json", include=REPORT_SUMMARY_FIELDS)
+            index[report.report_id] = self._summarize_report(summary_data)
+        self._write_report_index(reports_dir, index)
 
     def list_reports(self, user_id: str | None = None) -> list[dict]:
         """
@@ -255,36 +557,127 @@ class AdvisoryAgent:
         if not reports_dir.exists():
             return []
 
-        summaries = []
-        for report_file in reports_dir.glob("rpt_*.json"):
-            try:
-                with open(report_file, "r") as f:
-                    data = json.load(f)
-
-                # Filter by user_id if provided
-                if user_id and data.get("user_id") != user_id:
-                    continue
-
-                summaries.append({
-                    "report_id": data.get("report_id"),
-                    "user_id": data.get("user_id"),
-                    "tax_year": data.get("tax_year"),
-                    "generated_at": data.get("generated_at"),
-                    "total_tax": data.get("tax_calculation", {}).get("total_tax", 0),
-                    "potential_savings": (
-                        data.get("optimization_report", {}).get("total_potential_savings", 0)
-                        + data.get("deduction_finder_report", {}).get("total_potential_savings", 0)
-                    ),
-                })
-            except Exception as e:
-                print(f"Error loading report {report_file}: {e}")
-                continue
+        index = self._read_report_index(reports_dir)
+        if index is None:
+            index = self._rebuild_report_index(reports_dir)
+
+        summaries = [
+            summary
+            for summary in index.values()
+            if not user_id or summary.get("user_id") == user_id
+        ]
 
         # Sort by generated_at (newest first)
-        summaries.sort(key=lambda x: x.get("generated_at", ""), reverse=True)
+        summaries.sort(key=lambda x: x.get("generated_at") or "", reverse=True)
 
         return summaries
 
+    def _summarize_report(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract the fields list_reports returns from a serialized report.
+
+        Args:
+            data: Report as produced by AdvisoryReport.to_dict()
+
+        Returns:
+            Report summary
+        """
+        potential_savings = _money_dollars(
+            data, "optimization_report", "total_potential_savings"
+        ) + _money_dollars(data, "deduction_finder_report", "total_potential_savings")
+
+        return {
+            "report_id": data.get("report_id"),
+            "user_id": data.get("user_id"),
+            "tax_year": data.get("tax_year"),
+            "generated_at": data.get("generated_at"),
+            "total_tax": {"dollars": _money_dollars(data, "tax_calculation", "total_tax")},
+            "potential_savings": {"dollars": potential_savings},
+        }
+
+    def _read_report_index(self, reports_dir: Path) -> dict[str, dict] | None:
+        """
+        Read the report summary index.
+
+        Args:
+            reports_dir: Reports directory
+
+        Returns:
+            Mapping of report ID to summary, or None if the index is missing
+            or unreadable and needs rebuilding
+        """
+        try:
+            with open(reports_dir / REPORT_INDEX_FILE, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return index if isinstance(index, dict) else None
+
+    def _write_report_index(self, reports_dir: Path, index: dict[str, dict]) -> None:
+        """
+        Atomically write the report summary index.
+
+        Args:
+            reports_dir: Reports directory
+            index: Mapping of report ID to summary
+        """
+        index_path = reports_dir / REPORT_INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(index, f)
+            tmp_path.replace(index_path)
+        except OSError as e:
+            logger.warning("Could not write report index %s: %s", index_path, e)
+
+    def _rebuild_report_index(self, reports_dir: Path) -> dict[str, dict]:
+        """
+        Rebuild the report summary index by reading every saved report.
+
+        Args:
+            reports_dir: Reports directory
+
+        Returns:
+            Mapping of report ID to summary
+        """
+        with os.scandir(reports_dir) as entries:
+            report_paths = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("rpt_") and entry.name.endswith(".json")
+            ]
+
+        # Submit every file before collecting so reads overlap
+        with ThreadPoolExecutor(max_workers=REPORT_INDEX_WORKERS) as pool:
+            futures = [pool.submit(self._load_report_summary, path) for path in report_paths]
+            summaries = [future.result() for future in futures]
+
+        index = {
+            summary["report_id"]: summary for summary in summaries if summary is not None
+        }
+
+        self._write_report_index(reports_dir, index)
+        return index
+
+    def _load_report_summary(self, report_path: str) -> dict[str, Any] | None:
+        """
+        Read one saved report and summarize it.
+
+        Args:
+            report_path: Path to a report JSON file
+
+        Returns:
+            Report summary, or None if the file could not be read
+        """
+        try:
+            with open(report_path, "r") as f:
+                data = json.load(f)
+            return self._summarize_report(data)
+        except Exception as e:
+            logger.warning("Error loading report %s: %s", report_path, e)
+            return None
+
     def list_profiles(self, user_id: str | None = None) -> list[TaxProfile]:
         """
         List available TaxProfiles for analysis.
@@ -292,10 +685,26 @@ class AdvisoryAgent:
         Args:
             user_id: Optional user ID filter
 
+        Results are memoized per user for PROFILE_CACHE_TTL_SECONDS, so repeated
+        lookups (e.g. get_latest_profile in a batch loop) don't re-read the
+        profiles directory. Call invalidate_profile_cache after saving profiles.
+
         Returns:
             List of TaxProfile objects
         """
-        return self.profile_builder.list_profiles(user_id=user_id)
+        cached = self._profile_cache.get(user_id)
+        if cached is not None:
+            cached_at, profiles = cached
+            if time.monotonic() - cached_at < PROFILE_CACHE_TTL_SECONDS:
+                return list(profiles)
+
+        profiles = self.profile_builder.list_profiles(user_id=user_id)
+        self._profile_cache[user_id] = (time.monotonic(), profiles)
+        return list(profiles)
+
+    def invalidate_profile_cache(self) -> None:
+        """Forget memoized list_profiles results."""
+        self._profile_cache.clear()
 
     def get_latest_profile(self, user_id: str) -> TaxProfile | None:
         """
@@ -311,3 +720,24 @@ class AdvisoryAgent:
         if profiles:
             return profiles[0]  # ProfileBuilder sorts by updated_at desc
         return None
+
+
+def _money_dollars(data: dict[str, Any], section: str, field: str) -> float:
+    """
+    Read a serialized Money value from a report section.
+
+    Args:
+        data: Serialized report
+        section: Top-level key (e.g. "tax_calculation")
+        field: Money field within the section (e.g. "total_tax")
+
+    Returns:
+        Dollar amount, or 0.0 if the section or field is missing
+    """
+    if section not in data or field not in data[section]:
+        return 0.0
+
+    value = data[section][field]
+    if isinstance(value, dict):
+        return as_float(value.get("dollars"))
+    return as_float(value)
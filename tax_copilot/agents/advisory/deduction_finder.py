@@ -1,12 +1,29 @@
 """Deduction Finder Agent - identifies potentially missed deductions."""
 
+import heapq
+import logging
+from operator import itemgetter
 from typing import Any
 
 from tax_copilot.core.models import TaxProfile, Money
 from tax_copilot.agents.providers.base import LLMProvider, Message
-from tax_copilot.agents.utils import parse_json_response
-from .models import MissedDeduction, DeductionFinderReport
-from .prompts import get_deduction_finder_prompt
+from tax_copilot.agents.cache import LLMCache, make_cache_key, profile_fingerprint
+from tax_copilot.agents.utils import (
+    as_choice,
+    as_float,
+    as_str_list,
+    parse_json_response,
+)
+from .models import LEVELS, MissedDeduction, DeductionFinderReport
+from .prompts import DEDUCTION_FINDER_SCHEMA, get_deduction_finder_prompt
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of missed deductions kept in a report
+MAX_DEDUCTIONS = 10
+
+# Priority weight for each likelihood level
+_LIKELIHOOD = {"high": 1.0, "medium": 0.6, "low": 0.3}
 
 
 class DeductionFinder:
@@ -17,87 +34,138 @@ class DeductionFinder:
     they may have overlooked.
     """
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, cache: LLMCache | None = None):
         """
         Initialize the deduction finder.
 
         Args:
             llm_provider: LLM provider for deduction discovery
+            cache: Optional cache for parsed responses, keyed by profile
         """
         self.llm = llm_provider
+        self.cache = cache
 
-    async def analyze(self, profile: TaxProfile) -> DeductionFinderReport:
+    async def analyze(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None = None,
+    ) -> DeductionFinderReport:
         """
         Identify potentially missed deductions.
 
         Args:
             profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
             DeductionFinderReport with missed deductions
         """
         try:
-            prompt = get_deduction_finder_prompt(profile)
-
-            response = await self.llm.generate(
-                messages=[
-                    Message(
-                        role="user",
-                        content="Identify deductions and credits this taxpayer may have missed.",
-                    )
-                ],
-                system_prompt=prompt,
-                temperature=0.5,  # Balanced creativity and accuracy
-                max_tokens=3000,
+            if self.cache is None:
+                data = await self._request(profile, profile_data)
+            else:
+                key = make_cache_key("deduction_finder", profile_fingerprint(profile))
+                data = await self.cache.get_or_compute(
+                    key, lambda: self._request(profile, profile_data)
+                )
+
+            return self.build_report(data)
+
+        except Exception as e:
+            logger.warning("Deduction finder analysis failed: %s", e)
+            # Return empty report on failure
+            return DeductionFinderReport(
+                missed_deductions=[],
+                total_potential_savings=Money(dollars=0),
+                follow_up_questions=[],
             )
 
-            # Parse JSON response
-            data = parse_json_response(response.content)
-
-            # Build missed deduction objects
-            missed_deductions = []
-            for deduction_data in data.get("missed_deductions", []):
-                deduction = MissedDeduction(
-                    deduction_name=deduction_data.get("deduction_name", ""),
-                    category=deduction_data.get("category", ""),
-                    estimated_value=Money(dollars=deduction_data.get("estimated_value", 0)),
-                    likelihood=deduction_data.get("likelihood", "medium"),
-                    why_suggested=deduction_data.get("why_suggested", ""),
-                    follow_up_question=deduction_data.get("follow_up_question"),
-                    requirements=deduction_data.get("requirements", []),
-                )
+    async def _request(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Ask the LLM for missed deductions.
 
-                missed_deductions.append(deduction)
+        Args:
+            profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
-            # Sort by estimated_value * likelihood score
-            def priority_score(d: MissedDeduction) -> float:
-                likelihood_scores = {"high": 1.0, "medium": 0.6, "low": 0.3}
-                likelihood_mult = likelihood_scores.get(d.likelihood, 0.5)
-                return d.estimated_value.dollars * likelihood_mult
+        Returns:
+            Parsed JSON response
+        """
+        prompt = get_deduction_finder_prompt(profile, profile_data)
 
-            missed_deductions.sort(key=priority_score, reverse=True)
+        response = await self.llm.generate(
+            messages=[
+                Message(
+                    role="user",
+                    content="Identify deductions and credits this taxpayer may have missed.",
+                )
+            ],
+            system_prompt=prompt,
+            response_schema=DEDUCTION_FINDER_SCHEMA,
+            temperature=0.5,  # Balanced creativity and accuracy
+            max_tokens=1500,
+        )
 
-            # Calculate total potential savings
-            total_savings_dollars = sum(d.estimated_value.dollars for d in missed_deductions)
+        # Parse JSON response
+        return parse_json_response(response.content)
 
-            # Extract follow-up questions
-            follow_up_questions = [
-                d.follow_up_question
-                for d in missed_deductions
-                if d.follow_up_question
-            ]
+    def build_report(self, data: dict[str, Any]) -> DeductionFinderReport:
+        """
+        Build a DeductionFinderReport from parsed LLM output.
 
-            return DeductionFinderReport(
-                missed_deductions=missed_deductions,
-                total_potential_savings=Money(dollars=total_savings_dollars),
-                follow_up_questions=follow_up_questions,
-            )
+        Args:
+            data: Parsed JSON with a "missed_deductions" list
 
-        except Exception as e:
-            print(f"Deduction finder analysis failed: {e}")
-            # Return empty report on failure
-            return DeductionFinderReport(
-                missed_deductions=[],
-                total_potential_savings=Money(cents=0),
-                follow_up_questions=[],
+        Returns:
+            DeductionFinderReport with prioritized deductions and follow-up questions
+        """
+        # Rank the raw entries first so only the ones we keep are validated
+        scored = [
+            (_priority_score(d), d)
+            for d in data.get("missed_deductions", [])
+            if isinstance(d, dict)
+        ]
+        # Partial selection of the top entries; same order as a stable
+        # descending sort truncated to MAX_DEDUCTIONS
+        top = heapq.nlargest(MAX_DEDUCTIONS, scored, key=itemgetter(0))
+        raw_deductions = [d for _, d in top]
+
+        # Build missed deduction objects (already in priority order)
+        missed_deductions = []
+        follow_up_questions = []
+        total_savings_dollars = 0.0
+        for deduction_data in raw_deductions:
+            # Fields are normalized here, so skip per-item validation
+            follow_up_question = deduction_data.get("follow_up_question")
+            deduction = MissedDeduction.model_construct(
+                deduction_name=str(deduction_data.get("deduction_name") or ""),
+                category=str(deduction_data.get("category") or ""),
+                estimated_value=Money.model_construct(
+                    dollars=as_float(deduction_data.get("estimated_value"))
+                ),
+                likelihood=as_choice(deduction_data.get("likelihood"), LEVELS, "medium"),
+                why_suggested=str(deduction_data.get("why_suggested") or ""),
+                follow_up_question=str(follow_up_question) if follow_up_question else None,
+                requirements=as_str_list(deduction_data.get("requirements")),
             )
+
+            missed_deductions.append(deduction)
+            total_savings_dollars += deduction.estimated_value.dollars
+            if deduction.follow_up_question:
+                follow_up_questions.append(deduction.follow_up_question)
+
+        return DeductionFinderReport(
+            missed_deductions=missed_deductions,
+            total_potential_savings=Money(dollars=total_savings_dollars),
+            follow_up_questions=follow_up_questions,
+        )
+
+
+def _priority_score(deduction_data: dict[str, Any]) -> float:
+    """Rank a raw deduction by estimated value weighted by likelihood."""
+    likelihood_mult = _LIKELIHOOD.get(deduction_data.get("likelihood"), 0.5)
+    return as_float(deduction_data.get("estimated_value")) * likelihood_mult
@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 
 from tax_copilot.core.models import Money, TaxProfile
 
+# Allowed values of the "high"/"medium"/"low" Literal fields below
+LEVELS = ("high", "medium", "low")
+
 
 class TaxCalculation(BaseModel):
     """Result of tax calculation."""
@@ -85,6 +88,12 @@ class AdvisoryReport(BaseModel):
     llm_provider: str = "unknown"
     total_analysis_time_seconds: float = 0.0
 
+    # Token usage for the analysis (input_tokens excludes cached tokens)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON export."""
         return self.model_dump(mode="json")
@@ -1,12 +1,24 @@
 """Optimization Agent - identifies tax-saving strategies."""
 
+import logging
 from typing import Any
 
 from tax_copilot.core.models import TaxProfile, Money
 from tax_copilot.agents.providers.base import LLMProvider, Message
-from tax_copilot.agents.utils import parse_json_response
-from .models import OptimizationStrategy, OptimizationReport, TaxCalculation
-from .prompts import get_optimization_prompt
+from tax_copilot.agents.cache import LLMCache, make_cache_key, profile_fingerprint
+from tax_copilot.agents.utils import (
+    as_choice,
+    as_float,
+    as_str_list,
+    parse_json_response,
+)
+from .models import LEVELS, OptimizationStrategy, OptimizationReport, TaxCalculation
+from .prompts import CALCULATION_PROMPT_FIELDS, OPTIMIZATION_SCHEMA, get_optimization_prompt
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of strategies kept in a report
+MAX_STRATEGIES = 10
 
 
 class OptimizationAgent:
@@ -17,19 +29,22 @@ class OptimizationAgent:
     actionable strategies for reducing tax liability.
     """
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, cache: LLMCache | None = None):
         """
         Initialize the optimization agent.
 
         Args:
             llm_provider: LLM provider for strategy generation
+            cache: Optional cache for parsed responses, keyed by profile
         """
         self.llm = llm_provider
+        self.cache = cache
 
     async def analyze(
         self,
         profile: TaxProfile,
         calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None = None,
     ) -> OptimizationReport:
         """
         Identify tax optimization strategies.
@@ -37,64 +52,117 @@ class OptimizationAgent:
         Args:
             profile: User's TaxProfile
             calculation: Calculated tax liability
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
             OptimizationReport with suggested strategies
         """
         try:
-            prompt = get_optimization_prompt(profile, calculation)
-
-            response = await self.llm.generate(
-                messages=[
-                    Message(
-                        role="user",
-                        content="Identify tax optimization strategies for this taxpayer.",
-                    )
-                ],
-                system_prompt=prompt,
-                temperature=0.7,  # Higher temp for creative strategies
-                max_tokens=3000,
-            )
-
-            # Parse JSON response
-            data = parse_json_response(response.content)
-
-            # Build strategy objects
-            strategies = []
-            for strat_data in data.get("strategies", []):
-                strategy = OptimizationStrategy(
-                    strategy_id=strat_data.get("strategy_id", "unknown"),
-                    title=strat_data.get("title", ""),
-                    description=strat_data.get("description", ""),
-                    potential_savings=Money(cents=strat_data.get("potential_savings", 0)),
-                    effort_level=strat_data.get("effort_level", "medium"),
-                    deadline=strat_data.get("deadline"),
-                    action_steps=strat_data.get("action_steps", []),
-                    risks_considerations=strat_data.get("risks_considerations", []),
-                    confidence=strat_data.get("confidence", "medium"),
+            if self.cache is None:
+                data = await self._request(profile, calculation, profile_data)
+            else:
+                key = make_cache_key(
+                    "optimization",
+                    profile_fingerprint(profile),
+                    calculation.model_dump(mode="json", include=CALCULATION_PROMPT_FIELDS),
+                )
+                data = await self.cache.get_or_compute(
+                    key, lambda: self._request(profile, calculation, profile_data)
                 )
 
-                # Filter out low-value strategies (< $100 savings)
-                if strategy.potential_savings.dollars >= 100:
-                    strategies.append(strategy)
-
-            # Sort by potential savings (descending)
-            strategies.sort(key=lambda s: s.potential_savings.dollars, reverse=True)
-
-            # Calculate total potential savings
-            total_savings_dollars = sum(s.potential_savings.dollars for s in strategies)
-
-            return OptimizationReport(
-                strategies=strategies,
-                total_potential_savings=Money(dollars=total_savings_dollars),
-                reasoning=data.get("reasoning", ""),
-            )
+            return self.build_report(data)
 
         except Exception as e:
-            print(f"Optimization analysis failed: {e}")
+            logger.warning("Optimization analysis failed: %s", e)
             # Return empty report on failure
             return OptimizationReport(
                 strategies=[],
-                total_potential_savings=Money(cents=0),
+                total_potential_savings=Money(dollars=0),
                 reasoning=f"Analysis failed: {str(e)}",
             )
+
+    async def _request(
+        self,
+        profile: TaxProfile,
+        calculation: TaxCalculation,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Ask the LLM for optimization strategies.
+
+        Args:
+            profile: User's TaxProfile
+            calculation: Calculated tax liability
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Parsed JSON response
+        """
+        prompt = get_optimization_prompt(profile, calculation, profile_data)
+
+        response = await self.llm.generate(
+            messages=[
+                Message(
+                    role="user",
+                    content="Identify tax optimization strategies for this taxpayer.",
+                )
+            ],
+            system_prompt=prompt,
+            response_schema=OPTIMIZATION_SCHEMA,
+            temperature=0.7,  # Higher temp for creative strategies
+            max_tokens=1200,
+        )
+
+        # Parse JSON response
+        return parse_json_response(response.content)
+
+    def build_report(self, data: dict[str, Any]) -> OptimizationReport:
+        """
+        Build an OptimizationReport from parsed LLM output.
+
+        Args:
+            data: Parsed JSON with a "strategies" list and optional "reasoning"
+
+        Returns:
+            OptimizationReport with filtered, sorted strategies
+        """
+        # Drop low-value strategies (< $100 savings) and rank the raw entries
+        # first so only the ones we keep are validated
+        raw_strategies = [
+            strat_data
+            for strat_data in data.get("strategies", [])
+            if isinstance(strat_data, dict)
+            and as_float(strat_data.get("potential_savings")) >= 100
+        ]
+        raw_strategies.sort(
+            key=lambda strat_data: as_float(strat_data.get("potential_savings")), reverse=True
+        )
+        del raw_strategies[MAX_STRATEGIES:]
+
+        # Build strategy objects (already sorted by potential savings)
+        strategies = []
+        total_savings_dollars = 0.0
+        for strat_data in raw_strategies:
+            # Fields are normalized here, so skip per-item validation
+            deadline = strat_data.get("deadline")
+            strategy = OptimizationStrategy.model_construct(
+                strategy_id=str(strat_data.get("strategy_id") or "unknown"),
+                title=str(strat_data.get("title") or ""),
+                description=str(strat_data.get("description") or ""),
+                potential_savings=Money.model_construct(
+                    dollars=as_float(strat_data.get("potential_savings"))
+                ),
+                effort_level=as_choice(strat_data.get("effort_level"), LEVELS, "medium"),
+                deadline=str(deadline) if deadline else None,
+                action_steps=as_str_list(strat_data.get("action_steps")),
+                risks_considerations=as_str_list(strat_data.get("risks_considerations")),
+                confidence=as_choice(strat_data.get("confidence"), LEVELS, "medium"),
+            )
+            strategies.append(strategy)
+            total_savings_dollars += strategy.potential_savings.dollars
+
+        return OptimizationReport(
+            strategies=strategies,
+            total_potential_savings=Money(dollars=total_savings_dollars),
+            reasoning=data.get("reasoning", ""),
+        )
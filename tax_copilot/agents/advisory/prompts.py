@@ -1,35 +1,212 @@
 """Prompt templates for Tax Analysis & Advisory agents."""
 
+import json
 from typing import Any
 from tax_copilot.core.models import TaxProfile
+from tax_copilot.agents.providers.base import SystemPrompt
+from tax_copilot.agents.utils import estimate_tokens
 from .models import TaxCalculation
 
 
-def get_federal_tax_prompt(profile: TaxProfile) -> str:
+# TaxCalculation fields embedded in the advisory prompts; responses to those
+# prompts only depend on these (plus the profile)
+CALCULATION_PROMPT_FIELDS = {
+    "federal_tax",
+    "state_tax",
+    "total_tax",
+    "effective_tax_rate",
+    "marginal_tax_rate",
+}
+
+
+# JSON Schemas for structured output
+_LEVEL_SCHEMA = {"type": "string", "enum": ["high", "medium", "low"]}
+
+_STRATEGY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "strategy_id": {"type": "string"},
+        "title": {"type": "string"},
+        "description": {"type": "string"},
+        "potential_savings": {
+            "type": "number",
+            "description": "Estimated tax savings in dollars",
+        },
+        "effort_level": _LEVEL_SCHEMA,
+        "deadline": {"type": ["string", "null"]},
+        "action_steps": {"type": "array", "items": {"type": "string"}},
+        "risks_considerations": {"type": "array", "items": {"type": "string"}},
+        "confidence": _LEVEL_SCHEMA,
+    },
+    "required": ["strategy_id", "title", "description", "potential_savings"],
+}
+
+_MISSED_DEDUCTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "deduction_name": {"type": "string"},
+        "category": {"type": "string"},
+        "estimated_value": {
+            "type": "number",
+            "description": "Potential tax savings in dollars",
+        },
+        "likelihood": _LEVEL_SCHEMA,
+        "why_suggested": {"type": "string"},
+        "follow_up_question": {"type": ["string", "null"]},
+        "requirements": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["deduction_name", "category", "estimated_value", "likelihood"],
+}
+
+OPTIMIZATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "strategies": {"type": "array", "items": _STRATEGY_SCHEMA},
+        "reasoning": {"type": "string"},
+    },
+    "required": ["strategies", "reasoning"],
+}
+
+DEDUCTION_FINDER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "missed_deductions": {"type": "array", "items": _MISSED_DEDUCTION_SCHEMA},
+        "follow_up_questions": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["missed_deductions"],
+}
+
+_FEDERAL_TAX_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "federal_tax": {"type": "number", "description": "Tax liability in dollars"},
+        "breakdown": {"type": "object"},
+        "assumptions": {"type": "array", "items": {"type": "string"}},
+        "confidence": _LEVEL_SCHEMA,
+    },
+    "required": ["federal_tax", "breakdown", "confidence"],
+}
+
+_STATE_TAX_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "state_tax": {"type": "number", "description": "Tax liability in dollars"},
+        "has_income_tax": {"type": "boolean"},
+        "breakdown": {"type": "object"},
+        "assumptions": {"type": "array", "items": {"type": "string"}},
+        "confidence": _LEVEL_SCHEMA,
+    },
+    "required": ["state_tax", "confidence"],
+}
+
+COMBINED_TAX_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "federal": _FEDERAL_TAX_RESULT_SCHEMA,
+        "state": _STATE_TAX_RESULT_SCHEMA,
+    },
+    "required": ["federal", "state"],
+}
+
+COMBINED_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "strategies": {"type": "array", "items": _STRATEGY_SCHEMA},
+        "reasoning": {"type": "string"},
+        "missed_deductions": {"type": "array", "items": _MISSED_DEDUCTION_SCHEMA},
+        "executive_summary": {"type": "string"},
+        "top_recommendations": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "strategies",
+        "missed_deductions",
+        "executive_summary",
+        "top_recommendations",
+    ],
+}
+
+
+def format_profile_for_prompt(profile_data: dict[str, Any]) -> str:
     """
-    Generate prompt for federal tax calculation.
+    Render a compact profile dict (see TaxProfile.to_prompt_dict) for a prompt.
 
     Args:
-        profile: User's TaxProfile
+        profile_data: Compact profile dictionary
 
     Returns:
-        System prompt string
+        Profile section string
     """
-    return f"""You are a tax calculation expert with comprehensive knowledge of the {profile.tax_year} U.S. federal tax code.
-
-**User's Tax Profile:**
-- Filing Status: {profile.filing_status}
-- Total Income: ${profile.income.total_income.to_dollars():,.2f}
-- W-2 Jobs: {profile.income.w2_count}
-- IRA Contribution: ${profile.income.ira_contribution.to_dollars():,.2f}
-- Student Loan Interest: ${profile.deductions.student_loan_interest.to_dollars():,.2f}
-- Itemizing: {profile.deductions.itemized}
-- Itemized Deductions Total: ${profile.deductions.itemized_total.to_dollars():,.2f}
-- Dependents: {profile.dependents.count} (ages: {profile.dependents.ages if profile.dependents.ages else 'none'})
-- Claiming Child Tax Credit: {profile.dependents.claiming_child_tax_credit}
+    compact_json = json.dumps(profile_data, separators=(",", ":"))
+    return (
+        "**Taxpayer Profile** (money in whole dollars; fields that are zero, "
+        f"false or not provided are omitted):\n{compact_json}"
+    )
+
+
+# Providers only cache prompt prefixes of at least this many tokens
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Shared tax reference data. Prepended to static preambles that would
+# otherwise be too short for provider-side prompt caching.
+_TAX_REFERENCE_BLOCK = """**Tax Reference Data**
+
+Federal income tax brackets (taxable income thresholds where each rate starts):
+
+2024:
+| Rate | Single    | Married Filing Jointly | Married Filing Separately | Head of Household |
+|------|-----------|------------------------|---------------------------|-------------------|
+| 10%  | $0        | $0                     | $0                        | $0                |
+| 12%  | $11,600   | $23,200                | $11,600                   | $16,550           |
+| 22%  | $47,150   | $94,300                | $47,150                   | $63,100           |
+| 24%  | $100,525  | $201,050               | $100,525                  | $100,500          |
+| 32%  | $191,950  | $383,900               | $191,950                  | $191,950          |
+| 35%  | $243,725  | $487,450               | $243,725                  | $243,700          |
+| 37%  | $609,350  | $731,200               | $365,600                  | $609,350          |
+
+2025:
+| Rate | Single    | Married Filing Jointly | Married Filing Separately | Head of Household |
+|------|-----------|------------------------|---------------------------|-------------------|
+| 10%  | $0        | $0                     | $0                        | $0                |
+| 12%  | $11,925   | $23,850                | $11,925                   | $17,000           |
+| 22%  | $48,475   | $96,950                | $48,475                   | $64,850           |
+| 24%  | $103,350  | $206,700               | $103,350                  | $103,350          |
+| 32%  | $197,300  | $394,600               | $197,300                  | $197,300          |
+| 35%  | $250,525  | $501,050               | $250,525                  | $250,500          |
+| 37%  | $626,350  | $751,600               | $375,800                  | $626,350          |
+
+Standard deduction:
+| Year | Single / MFS | Married Filing Jointly | Head of Household |
+|------|--------------|------------------------|-------------------|
+| 2024 | $14,600      | $29,200                | $21,900           |
+| 2025 | $15,750      | $31,500                | $23,625           |
+
+Long-term capital gains / qualified dividends rates (taxable income where each rate starts):
+| Year | Rate | Single   | Married Filing Jointly | Married Filing Separately | Head of Household |
+|------|------|----------|------------------------|---------------------------|-------------------|
+| 2024 | 15%  | $47,026  | $94,051                | $47,026                   | $63,001           |
+| 2024 | 20%  | $518,901 | $583,751               | $291,851                  | $551,351          |
+| 2025 | 15%  | $48,351  | $96,701                | $48,351                   | $64,751           |
+| 2025 | 20%  | $533,401 | $600,051               | $300,001                  | $566,701          |
+
+Other limits:
+- 401(k)/403(b) employee deferral limit: $23,000 (2024), $23,500 (2025), plus $7,500 catch-up at age 50+
+- HSA contribution limit: $4,150 self-only / $8,300 family (2024); $4,300 / $8,550 (2025)
+- Child Tax Credit: $2,000 per qualifying child under 17 (2024), $2,200 (2025)
+- Traditional/Roth IRA contribution limit: $7,000, plus $1,000 catch-up at age 50+ (2024 and 2025)
+- Student loan interest deduction: up to $2,500
+- SALT itemized deduction cap: $10,000 ($5,000 MFS) for 2024; $40,000 ($20,000 MFS) for 2025, reduced above $500,000 MAGI
+- Medical expenses: deductible above 7.5% of AGI when itemizing
+
+States with no tax on wage income: AK, FL, NV, NH, SD, TN, TX, WA, WY"""
+
+# Static prompt bodies. Each prompt starts with its static block and appends
+# the taxpayer-specific data at the end, so consecutive calls share an
+# identical prefix that provider-side prompt caching can reuse.
+
+_FEDERAL_STATIC_PREAMBLE = """You are a tax calculation expert with comprehensive knowledge of the U.S. federal tax code.
 
 **Your Task:**
-Calculate the estimated federal income tax liability for {profile.tax_year} using the current tax code.
+Calculate the estimated federal income tax liability for the tax year given below using the tax code for that year.
 
 **Calculation Steps:**
 1. Calculate Adjusted Gross Income (AGI):
@@ -43,25 +220,25 @@ Calculate the estimated federal income tax liability for {profile.tax_year} usin
      b) Itemized deductions (if itemizing and > standard deduction)
 
 3. Calculate Tax Before Credits:
-   - Apply {profile.tax_year} tax brackets for filing status: {profile.filing_status}
+   - Apply the tax year's brackets for the taxpayer's filing status
    - Calculate tax owed on taxable income
 
 4. Apply Tax Credits:
-   - Child Tax Credit (if applicable): $2,000 per qualifying child under 17
+   - Child Tax Credit (if applicable): the tax year's per-child amount from the reference data above, per qualifying child under 17
    - Other applicable credits
 
 5. Calculate Final Tax Liability
 
 **Important Considerations:**
-- Use {profile.tax_year} tax brackets and standard deduction amounts
+- Use the tax year's brackets and standard deduction amounts
 - Phase-outs and income limits for deductions/credits
 - FICA taxes (Social Security + Medicare) are separate from income tax
 - This is an ESTIMATE for planning purposes
 
 **Response Format (JSON):**
-{{
+{
   "federal_tax": <tax liability in dollars, no commas>,
-  "breakdown": {{
+  "breakdown": {
     "total_income": <in dollars, no commas>,
     "agi": <in dollars, no commas>,
     "taxable_income": <in dollars, no commas>,
@@ -72,40 +249,21 @@ Calculate the estimated federal income tax liability for {profile.tax_year} usin
     "final_tax": <in dollars, no commas>,
     "marginal_tax_rate": <percentage>,
     "effective_tax_rate": <percentage>
-  }},
+  },
   "assumptions": [
     "List any assumptions made (e.g., 'Assumed no other income sources', 'Used standard deduction')"
   ],
   "confidence": "high" or "medium" or "low"
-}}
+}
 
 **IMPORTANT**:
 - Use plain numbers without commas (e.g., 891450 not 891,450)
 - Return ONLY valid JSON, nothing else"""
 
-
-def get_state_tax_prompt(profile: TaxProfile) -> str:
-    """
-    Generate prompt for state tax calculation.
-
-    Args:
-        profile: User's TaxProfile
-
-    Returns:
-        System prompt string
-    """
-    state = profile.state or "unknown"
-
-    return f"""You are a tax calculation expert with comprehensive knowledge of U.S. state income taxes for {profile.tax_year}.
-
-**User's Tax Profile:**
-- State: {state}
-- Filing Status: {profile.filing_status}
-- Total Income: ${profile.income.total_income.to_dollars():,.2f}
-- Federal AGI: ${profile.income.total_income.to_dollars():,.2f} (approximate)
+_STATE_STATIC_PREAMBLE = """You are a tax calculation expert with comprehensive knowledge of U.S. state income taxes.
 
 **Your Task:**
-Calculate the estimated state income tax liability for {state} in {profile.tax_year}.
+Calculate the estimated state income tax liability for the state and tax year given below.
 
 **Important Notes:**
 - Some states have NO income tax (AK, FL, NV, NH, SD, TN, TX, WY, WA)
@@ -114,61 +272,97 @@ Calculate the estimated state income tax liability for {state} in {profile.tax_y
 - This is an ESTIMATE for planning purposes
 
 **Response Format (JSON):**
-{{
+{
   "state_tax": <tax liability in dollars, 0 if no state income tax>,
   "has_income_tax": true or false,
-  "breakdown": {{
+  "breakdown": {
     "state_taxable_income": <in dollars>,
     "state_tax_rate": <percentage if flat tax, or "progressive">,
     "state_standard_deduction": <in dollars>,
     "final_state_tax": <in dollars>
-  }},
+  },
   "assumptions": [
     "List any assumptions made"
   ],
   "confidence": "high" or "medium" or "low"
-}}
+}
 
-If {state} is "unknown" or not provided, return:
-{{
+If the state is "unknown" or not provided, return:
+{
   "state_tax": 0,
   "has_income_tax": false,
-  "breakdown": {{}},
+  "breakdown": {},
   "assumptions": ["State not provided, cannot calculate state tax"],
   "confidence": "low"
-}}
+}
 
 **IMPORTANT**:
 - Use plain numbers without commas (e.g., 50000 not 50,000)
 - Return ONLY valid JSON, nothing else"""
 
+_COMBINED_TAX_STATIC_PREAMBLE = """You are a tax calculation expert with comprehensive knowledge of the U.S. federal tax code and state income taxes.
 
-def get_optimization_prompt(profile: TaxProfile, calculation: TaxCalculation) -> str:
-    """
-    Generate prompt for tax optimization strategies.
+**Your Task:**
+Calculate both the estimated federal income tax and the estimated state income tax liability for the state and tax year given below, using the tax code for that year.
 
-    Args:
-        profile: User's TaxProfile
-        calculation: Calculated tax liability
+**Federal Calculation Steps:**
+1. AGI: total income minus above-the-line deductions (IRA contribution, student loan interest up to $2,500)
+2. Taxable income: AGI minus the larger of the standard deduction for the filing status or itemized deductions (if itemizing)
+3. Tax before credits: apply the tax year's brackets for the filing status
+4. Credits: Child Tax Credit for qualifying children under 17, plus other applicable credits
+5. Final federal tax liability
 
-    Returns:
-        System prompt string
-    """
-    return f"""You are a tax planning expert helping users optimize their tax situation.
+**State Calculation Notes:**
+- Some states have NO income tax (AK, FL, NV, NH, SD, TN, TX, WY, WA)
+- Each state has its own brackets, deductions, and credits
+- State tax often uses federal AGI as a starting point; use the AGI from your federal calculation
 
-**User's Current Tax Situation:**
-- Filing Status: {profile.filing_status}
-- Total Income: ${profile.income.total_income.to_dollars():,.2f}
-- Current Federal Tax: ${calculation.federal_tax.to_dollars():,.2f}
-- Current State Tax: ${calculation.state_tax.to_dollars():,.2f}
-- Effective Tax Rate: {calculation.effective_tax_rate:.1f}%
-- Marginal Tax Rate: {calculation.marginal_tax_rate:.1f}%
-- IRA Contribution (current): ${profile.income.ira_contribution.to_dollars():,.2f}
-- Itemizing: {profile.deductions.itemized}
-- Dependents: {profile.dependents.count}
+**Important Considerations:**
+- Phase-outs and income limits for deductions/credits
+- FICA taxes (Social Security + Medicare) are separate from income tax
+- These are ESTIMATES for planning purposes
+
+**Response Format (JSON):**
+{
+  "federal": {
+    "federal_tax": <tax liability in dollars, no commas>,
+    "breakdown": {
+      "total_income": <in dollars>,
+      "agi": <in dollars>,
+      "taxable_income": <in dollars>,
+      "standard_deduction": <in dollars>,
+      "tax_before_credits": <in dollars>,
+      "child_tax_credit": <in dollars>,
+      "total_credits": <in dollars>,
+      "final_tax": <in dollars>,
+      "marginal_tax_rate": <percentage>,
+      "effective_tax_rate": <percentage>
+    },
+    "assumptions": ["Assumptions made for the federal calculation"],
+    "confidence": "high" or "medium" or "low"
+  },
+  "state": {
+    "state_tax": <tax liability in dollars, 0 if no state income tax>,
+    "has_income_tax": true or false,
+    "breakdown": {
+      "state_taxable_income": <in dollars>,
+      "state_tax_rate": <percentage if flat tax, or "progressive">,
+      "state_standard_deduction": <in dollars>,
+      "final_state_tax": <in dollars>
+    },
+    "assumptions": ["Assumptions made for the state calculation"],
+    "confidence": "high" or "medium" or "low"
+  }
+}
+
+**IMPORTANT**:
+- Use plain numbers without commas (e.g., 50000 not 50,000)
+- Return ONLY valid JSON, nothing else"""
+
+_OPTIMIZATION_STATIC_PREAMBLE = """You are a tax planning expert helping users optimize their tax situation.
 
 **Your Task:**
-Identify 3-5 actionable tax optimization strategies that could reduce their {profile.tax_year} tax liability.
+Identify 3-5 actionable tax optimization strategies that could reduce the taxpayer's liability for the tax year given below.
 
 **Focus Areas:**
 1. Retirement contributions (Traditional IRA, 401(k) if applicable)
@@ -187,18 +381,18 @@ Identify 3-5 actionable tax optimization strategies that could reduce their {pro
 - Consider their current situation (don't suggest IRA if already maxed)
 
 **Response Format (JSON):**
-{{
+{
   "strategies": [
-    {{
+    {
       "strategy_id": "ira_contribution",
       "title": "Maximize Traditional IRA Contribution",
-      "description": "You're currently in the {calculation.marginal_tax_rate:.0f}% tax bracket. Contributing the maximum $6,500 (or $7,500 if 50+) to a traditional IRA would reduce your taxable income and save approximately $X in taxes.",
+      "description": "You're currently in the 22% tax bracket. Contributing the maximum $7,000 (or $8,000 if 50+) to a traditional IRA would reduce your taxable income and save approximately $X in taxes.",
       "potential_savings": <estimated tax savings in dollars>,
       "effort_level": "low" or "medium" or "high",
-      "deadline": "April 15, {profile.tax_year + 1}",
+      "deadline": "April 15 of the following year",
       "action_steps": [
         "Open traditional IRA account if you don't have one",
-        "Contribute up to $6,500 before April 15 deadline",
+        "Contribute up to $7,000 before April 15 deadline",
         "Verify you're within income limits for IRA deduction"
       ],
       "risks_considerations": [
@@ -206,45 +400,21 @@ Identify 3-5 actionable tax optimization strategies that could reduce their {pro
         "Funds are locked until age 59.5 (with exceptions)"
       ],
       "confidence": "high" or "medium" or "low"
-    }},
+    },
     // ... 2-4 more strategies
   ],
   "total_potential_savings": <sum of all strategy savings in dollars>,
   "reasoning": "Brief explanation of why these specific strategies were chosen based on the user's situation"
-}}
+}
 
 **IMPORTANT**:
 - Use plain numbers without commas (e.g., 1430 not 1,430)
 - Return ONLY valid JSON, nothing else"""
 
-
-def get_deduction_finder_prompt(profile: TaxProfile) -> str:
-    """
-    Generate prompt for finding missed deductions.
-
-    Args:
-        profile: User's TaxProfile
-
-    Returns:
-        System prompt string
-    """
-    return f"""You are a tax deduction expert helping users identify deductions and credits they may have missed.
-
-**User's Current Tax Profile:**
-- Filing Status: {profile.filing_status}
-- Total Income: ${profile.income.total_income.to_dollars():,.2f}
-- State: {profile.state or 'not provided'}
-- Dependents: {profile.dependents.count} (ages: {profile.dependents.ages if profile.dependents.ages else 'none'})
-- Currently Itemizing: {profile.deductions.itemized}
-- Student Loan Interest (claimed): ${profile.deductions.student_loan_interest.to_dollars():,.2f}
-
-**What We Know They Have:**
-- W-2 income: {profile.income.w2_count} job(s)
-- IRA contribution: ${profile.income.ira_contribution.to_dollars():,.2f}
-- Student loan interest: ${profile.deductions.student_loan_interest.to_dollars():,.2f}
+_DEDUCTION_FINDER_STATIC_PREAMBLE = """You are a tax deduction expert helping users identify deductions and credits they may have missed.
 
 **Your Task:**
-Identify common deductions and credits this person might qualify for but haven't mentioned.
+Identify common deductions and credits the taxpayer described below might qualify for but hasn't mentioned.
 
 **Common Deductions/Credits to Consider:**
 - Charitable contributions
@@ -267,95 +437,333 @@ Identify common deductions and credits this person might qualify for but haven't
 - Consider their income level (some credits phase out at high incomes)
 
 **Response Format (JSON):**
-{{
+{
   "missed_deductions": [
-    {{
+    {
       "deduction_name": "Charitable Contributions",
       "category": "itemized_deduction",
       "estimated_value": <potential tax savings in dollars>,
       "likelihood": "high" or "medium" or "low",
       "why_suggested": "Most taxpayers make charitable donations but forget to track them. Even if not itemizing, there may be special provisions.",
-      "follow_up_question": "Did you make any charitable donations to qualified organizations in {profile.tax_year}? This includes cash, goods, or appreciated assets.",
+      "follow_up_question": "Did you make any charitable donations to qualified organizations this tax year? This includes cash, goods, or appreciated assets.",
       "requirements": [
         "Donations must be to qualified 501(c)(3) organizations",
         "Need receipts for donations over $250",
         "Only beneficial if itemizing (unless special provision)"
       ]
-    }},
+    },
     // ... more missed deductions
   ],
   "total_potential_savings": <sum of all estimated savings in dollars>,
   "follow_up_questions": [
-    "Did you make any charitable donations in {profile.tax_year}?",
+    "Did you make any charitable donations this tax year?",
     "Are you a teacher? You may qualify for educator expense deduction.",
     // ... more questions
   ]
-}}
+}
 
 **IMPORTANT**:
 - Use plain numbers without commas (e.g., 1500 not 1,500)
 - Return ONLY valid JSON, nothing else"""
 
+_EXECUTIVE_SUMMARY_STATIC_PREAMBLE = """You are a tax advisor creating an executive summary for a client.
+
+**Your Task:**
+Write the opening 1-2 paragraphs of an executive summary that:
+1. Summarizes their current tax situation
+2. Explains what their effective and marginal rates mean for them
+3. Sets up the recommendations that follow
+
+Do NOT list specific strategies or deductions - a paragraph with the analysis
+findings will be appended after your text.
+
+**Tone:**
+- Professional but friendly
+- Clear and non-technical language
+- Include specific dollar amounts
+
+**Response Format (JSON):**
+{
+  "executive_summary": "Your 1-2 paragraph summary here..."
+}
+
+Provide ONLY the JSON response, nothing else."""
+
+_COMBINED_ANALYSIS_STATIC_PREAMBLE = """You are a tax planning expert and advisor. In ONE response, identify tax optimization strategies, find deductions and credits the taxpayer may have missed, and write an executive summary of your findings.
+
+**Task 1 - Optimization Strategies:**
+Identify 3-5 actionable, LEGAL strategies that could reduce their tax liability for the tax year given below
+(retirement contributions, bracket management, deduction bunching, credits, timing, HSA/529).
+Prioritize by savings, prefer low effort, include deadlines, be realistic, and don't suggest
+anything they already maxed out.
+
+**Task 2 - Missed Deductions and Credits:**
+Identify deductions and credits they are LIKELY to qualify for but haven't mentioned
+(charitable, mortgage interest, SALT, medical > 7.5% of AGI, child and dependent care, EITC,
+education credits, Saver's Credit, energy credits). Don't repeat what they already claim,
+estimate conservatively, consider phase-outs, and include a follow-up question for each.
+
+**Task 3 - Executive Summary:**
+Write a concise 2-3 paragraph summary (professional, friendly, non-technical, with specific
+dollar amounts) of their tax situation and the findings from Tasks 1 and 2, plus the three
+most impactful action items.
+
+**Response Format (JSON):**
+{
+  "strategies": [
+    {
+      "strategy_id": "ira_contribution",
+      "title": "Maximize Traditional IRA Contribution",
+      "description": "Why this helps, with an estimated dollar impact",
+      "potential_savings": <estimated tax savings in dollars>,
+      "effort_level": "low" or "medium" or "high",
+      "deadline": "April 15 of the following year",
+      "action_steps": ["Concrete step 1", "Concrete step 2"],
+      "risks_considerations": ["Thing to watch out for"],
+      "confidence": "high" or "medium" or "low"
+    }
+  ],
+  "reasoning": "Brief explanation of why these strategies were chosen",
+  "missed_deductions": [
+    {
+      "deduction_name": "Charitable Contributions",
+      "category": "itemized_deduction" or "tax_credit" or "above_the_line",
+      "estimated_value": <potential tax savings in dollars>,
+      "likelihood": "high" or "medium" or "low",
+      "why_suggested": "Why this taxpayer may qualify",
+      "follow_up_question": "Question to confirm eligibility",
+      "requirements": ["What's needed to claim it"]
+    }
+  ],
+  "executive_summary": "Your 2-3 paragraph summary here...",
+  "top_recommendations": [
+    "Most impactful action item 1",
+    "Most impactful action item 2",
+    "Most impactful action item 3"
+  ]
+}
+
+**IMPORTANT**:
+- Use plain numbers without commas (e.g., 1430 not 1,430)
+- Return ONLY valid JSON, nothing else"""
+
+
+def _with_reference_block(preamble: str) -> str:
+    """
+    Prepend the tax reference block to a static preamble that is too short to cache.
+
+    Args:
+        preamble: Static prompt preamble
+
+    Returns:
+        Preamble, with the reference block in front if it was below
+        PROMPT_CACHE_MIN_TOKENS
+    """
+    if estimate_tokens(preamble) >= PROMPT_CACHE_MIN_TOKENS:
+        return preamble
+    return f"{_TAX_REFERENCE_BLOCK}\n\n---\n\n{preamble}"
+
+
+_FEDERAL_STATIC_PREAMBLE = _with_reference_block(_FEDERAL_STATIC_PREAMBLE)
+_STATE_STATIC_PREAMBLE = _with_reference_block(_STATE_STATIC_PREAMBLE)
+_COMBINED_TAX_STATIC_PREAMBLE = _with_reference_block(_COMBINED_TAX_STATIC_PREAMBLE)
+_OPTIMIZATION_STATIC_PREAMBLE = _with_reference_block(_OPTIMIZATION_STATIC_PREAMBLE)
+_DEDUCTION_FINDER_STATIC_PREAMBLE = _with_reference_block(_DEDUCTION_FINDER_STATIC_PREAMBLE)
+_EXECUTIVE_SUMMARY_STATIC_PREAMBLE = _with_reference_block(_EXECUTIVE_SUMMARY_STATIC_PREAMBLE)
+_COMBINED_ANALYSIS_STATIC_PREAMBLE = _with_reference_block(_COMBINED_ANALYSIS_STATIC_PREAMBLE)
+
+
+def _format_calculation(calculation: TaxCalculation, title: str) -> str:
+    """
+    Render the calculated tax figures for the dynamic part of a prompt.
+
+    Args:
+        calculation: Calculated tax liability
+        title: Section heading
+
+    Returns:
+        Calculation section string
+    """
+    return f"""**{title}:**
+- Federal Tax: ${calculation.federal_tax.to_dollars():,.2f}
+- State Tax: ${calculation.state_tax.to_dollars():,.2f}
+- Total Tax: ${calculation.total_tax.to_dollars():,.2f}
+- Effective Tax Rate: {calculation.effective_tax_rate:.1f}%
+- Marginal Tax Rate: {calculation.marginal_tax_rate:.1f}%"""
+
+
+def get_federal_tax_prompt(
+    profile: TaxProfile,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for federal tax calculation.
+
+    Args:
+        profile: User's TaxProfile
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
+
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+
+    dynamic = f"""**Tax Year:** {profile.tax_year}
+
+{profile_section}"""
+
+    return SystemPrompt(static=_FEDERAL_STATIC_PREAMBLE, dynamic=dynamic)
+
+
+def get_state_tax_prompt(
+    profile: TaxProfile,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for state tax calculation.
+
+    Args:
+        profile: User's TaxProfile
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
+
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+
+    dynamic = f"""**Tax Year:** {profile.tax_year}
+**State:** {profile.state or "unknown"}
+
+{profile_section}
+
+Use total income as an approximation of federal AGI."""
+
+    return SystemPrompt(static=_STATE_STATIC_PREAMBLE, dynamic=dynamic)
+
+
+def get_combined_tax_prompt(
+    profile: TaxProfile,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for calculating federal and state tax in one call.
+
+    Args:
+        profile: User's TaxProfile
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
 
-def get_executive_summary_prompt(
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+
+    dynamic = f"""**Tax Year:** {profile.tax_year}
+**State:** {profile.state or "unknown"}
+
+{profile_section}"""
+
+    return SystemPrompt(static=_COMBINED_TAX_STATIC_PREAMBLE, dynamic=dynamic)
+
+
+def get_optimization_prompt(
     profile: TaxProfile,
     calculation: TaxCalculation,
-    optimization_report: Any,
-    deduction_report: Any,
-) -> str:
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
     """
-    Generate prompt for executive summary.
+    Generate prompt for tax optimization strategies.
+
+    Args:
+        profile: User's TaxProfile
+        calculation: Calculated tax liability
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
+
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+    calculation_section = _format_calculation(calculation, "User's Current Tax Situation")
+
+    dynamic = f"""{profile_section}
+
+{calculation_section}"""
+
+    return SystemPrompt(static=_OPTIMIZATION_STATIC_PREAMBLE, dynamic=dynamic)
+
+
+def get_deduction_finder_prompt(
+    profile: TaxProfile,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for finding missed deductions.
+
+    Args:
+        profile: User's TaxProfile
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
+
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+
+    return SystemPrompt(static=_DEDUCTION_FINDER_STATIC_PREAMBLE, dynamic=profile_section)
+
+
+def get_executive_summary_preamble_prompt(
+    profile: TaxProfile,
+    calculation: TaxCalculation,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for the executive summary preamble.
+
+    The preamble only depends on the profile and calculation, so it can be
+    generated in parallel with the optimization and deduction analyses. The
+    findings paragraph is appended afterwards by the advisory agent.
 
     Args:
         profile: User's TaxProfile
         calculation: Tax calculation results
-        optimization_report: Optimization strategies
-        deduction_report: Missed deductions
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
 
     Returns:
-        System prompt string
+        SystemPrompt with the static preamble and taxpayer-specific tail
     """
-    num_strategies = len(optimization_report.strategies) if hasattr(optimization_report, 'strategies') else 0
-    num_missed = len(deduction_report.missed_deductions) if hasattr(deduction_report, 'missed_deductions') else 0
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+    calculation_section = _format_calculation(calculation, "Client's Tax Situation")
 
-    return f"""You are a tax advisor creating an executive summary for a client.
+    dynamic = f"""{profile_section}
 
-**Client's Tax Situation:**
-- Tax Year: {profile.tax_year}
-- Filing Status: {profile.filing_status}
-- Income: ${profile.income.total_income.to_dollars():,.2f}
-- Estimated Federal Tax: ${calculation.federal_tax.to_dollars():,.2f}
-- Estimated State Tax: ${calculation.state_tax.to_dollars():,.2f}
-- Total Tax: ${calculation.total_tax.to_dollars():,.2f}
-- Effective Tax Rate: {calculation.effective_tax_rate:.1f}%
+{calculation_section}"""
 
-**Analysis Results:**
-- Identified {num_strategies} optimization strategies
-- Potential savings from strategies: ${optimization_report.total_potential_savings.to_dollars():,.2f}
-- Identified {num_missed} potentially missed deductions
-- Potential savings from missed deductions: ${deduction_report.total_potential_savings.to_dollars():,.2f}
+    return SystemPrompt(static=_EXECUTIVE_SUMMARY_STATIC_PREAMBLE, dynamic=dynamic)
 
-**Your Task:**
-Write a concise executive summary (2-3 paragraphs) that:
-1. Summarizes their current tax situation
-2. Highlights the most important findings
-3. Emphasizes total potential savings
-4. Encourages action on the recommendations
 
-**Tone:**
-- Professional but friendly
-- Clear and non-technical language
-- Encouraging and actionable
-- Include specific dollar amounts
+def get_combined_analysis_prompt(
+    profile: TaxProfile,
+    calculation: TaxCalculation,
+    profile_data: dict[str, Any] | None = None,
+) -> SystemPrompt:
+    """
+    Generate prompt for the combined optimization, deduction and summary analysis.
 
-**Response Format (JSON):**
-{{
-  "executive_summary": "Your 2-3 paragraph summary here...",
-  "top_recommendations": [
-    "Most impactful action item 1",
-    "Most impactful action item 2",
-    "Most impactful action item 3"
-  ]
-}}
+    Serializes the profile once and asks for all three advisory outputs in a
+    single response, replacing three separate LLM calls.
 
-Provide ONLY the JSON response, nothing else."""
+    Args:
+        profile: User's TaxProfile
+        calculation: Calculated tax liability
+        profile_data: Precomputed profile.to_prompt_dict() (computed if None)
+
+    Returns:
+        SystemPrompt with the static preamble and taxpayer-specific tail
+    """
+    profile_section = format_profile_for_prompt(profile_data or profile.to_prompt_dict())
+    calculation_section = _format_calculation(calculation, "Calculated Taxes")
+
+    dynamic = f"""{profile_section}
+
+{calculation_section}"""
+
+    return SystemPrompt(static=_COMBINED_ANALYSIS_STATIC_PREAMBLE, dynamic=dynamic)
@@ -1,17 +1,83 @@
 """Report Generator - creates human-readable tax advisory reports."""
 
-import json
-from datetime import datetime
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
 from typing import Literal
 
-from tax_copilot.core.models import TaxProfile
+from tax_copilot.core.models import Money, TaxProfile
+from tax_copilot.agents.utils import as_float
 from .models import (
     TaxCalculation,
+    OptimizationStrategy,
     OptimizationReport,
+    MissedDeduction,
     DeductionFinderReport,
     AdvisoryReport,
 )
 
+# Maximum number of rendered markdown reports kept per generator
+MARKDOWN_CACHE_SIZE = 256
+
+# Strategies/deductions kept in a generated report (lists are already ranked)
+REPORT_MAX_ITEMS = 5
+
+# Profile fields read by to_markdown; only these are part of the cache key
+_MARKDOWN_PROFILE_FIELDS = {"filing_status": True, "state": True, "income": {"total_income"}}
+
+# Horizontal rule between report sections
+_SECTION_SEP = "\n\n---\n\n"
+
+_LIABILITY_TABLE_HEADER = (
+    "| Category              | Amount      |\n"
+    "|-----------------------|-------------|"
+)
+
+_EFFORT_EMOJI = {"low": "🟢", "medium": "🟡", "high": "🔴"}
+_LIKELIHOOD_EMOJI = {"high": "🟢", "medium": "🟡", "low": "🔴"}
+_DEFAULT_EMOJI = "⚪"
+
+# Per-item blocks; optional *_block fields are "" or start with a blank line
+_STRATEGY_TEMPLATE = (
+    "### {i}. {title} {money_emoji} Est. Savings: {savings}\n\n"
+    "{description}{action_block}{deadline_block}\n\n"
+    "**Effort**: {effort_emoji} {effort}{risks_block}"
+)
+
+_DEDUCTION_TEMPLATE = (
+    "### {name} {likelihood_emoji} (Est. {value})\n\n"
+    "{why}{question_block}{requirements_block}"
+)
+
+# Default executive summary, used when the LLM did not provide one
+_EXECUTIVE_SUMMARY_TEMPLATE = (
+    "Based on your {year} tax profile with an income of {income}, your estimated "
+    "federal tax liability is {federal} ({rate:.1f}% effective rate). "
+    "{state_sentence}\n\n{outlook}"
+)
+
+_SAVINGS_OUTLOOK_TEMPLATE = (
+    "We've identified optimization strategies and potential deductions that could "
+    "save you approximately {savings} in taxes. The recommendations below are "
+    "prioritized by potential impact and ease of implementation."
+)
+
+_WELL_OPTIMIZED_OUTLOOK = (
+    "Your tax situation appears well-optimized. We haven't identified significant "
+    "additional tax-saving opportunities at this time."
+)
+
+# Bound once so the format spec isn't re-parsed for every amount
+_format_dollars = "${:,.2f}".format
+
+_DISCLAIMER_SECTION = (
+    "## Disclaimer\n\n"
+    "This analysis is for planning purposes only and does not constitute "
+    "professional tax advice. Tax laws are complex and subject to change. "
+    "Consult a licensed tax professional or CPA before making tax decisions.\n"
+)
+
 
 class ReportGenerator:
     """
@@ -22,6 +88,10 @@ class ReportGenerator:
     - JSON (for programmatic access)
     """
 
+    def __init__(self):
+        """Initialize report generator."""
+        self._markdown_cache: OrderedDict[str, str] = OrderedDict()
+
     def generate(
         self,
         profile: TaxProfile,
@@ -30,6 +100,10 @@ class ReportGenerator:
         missed_deductions: DeductionFinderReport,
         executive_summary: str = "",
         top_recommendations: list[str] | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
     ) -> AdvisoryReport:
         """
         Generate complete advisory report.
@@ -41,12 +115,20 @@ class ReportGenerator:
             missed_deductions: Missed deductions/credits
             executive_summary: Executive summary text
             top_recommendations: Top 3 recommendations
+            input_tokens: Uncached prompt tokens used by the analysis
+            output_tokens: Completion tokens used by the analysis
+            cache_read_tokens: Prompt tokens served from the provider cache
+            cache_creation_tokens: Prompt tokens written to the provider cache
 
         Returns:
             AdvisoryReport object
         """
-        # Generate report ID
-        report_id = f"rpt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{id(profile) % 100000:05d}"
+        # Generate report ID (hex nanosecond timestamp sorts chronologically)
+        report_id = f"rpt_{time.time_ns():x}_{secrets.token_hex(3)}"
+
+        # Keep only the top-ranked items so the report and its JSON stay bounded
+        optimizations = _cap_optimizations(optimizations)
+        missed_deductions = _cap_deductions(missed_deductions)
 
         # Build executive summary if not provided
         if not executive_summary:
@@ -60,22 +142,32 @@ class ReportGenerator:
                 optimizations, missed_deductions
             )
 
+        # Single read of the profile's field values for the ID lookups
+        fields = vars(profile)
+
         return AdvisoryReport(
             report_id=report_id,
-            profile_id=profile.session_id if hasattr(profile, "session_id") else None,
-            user_id=getattr(profile, "user_id", "unknown"),
+            profile_id=fields.get("session_id"),
+            user_id=fields.get("user_id", "unknown"),
             tax_year=profile.tax_year,
             tax_calculation=calculation,
             optimization_report=optimizations,
             deduction_finder_report=missed_deductions,
             executive_summary=executive_summary,
             top_recommendations=top_recommendations,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_creation_tokens=cache_creation_tokens,
         )
 
     def to_markdown(self, report: AdvisoryReport, profile: TaxProfile) -> str:
         """
         Convert report to markdown format.
 
+        Rendered output is memoized on a hash of the report and the profile
+        fields it displays, so re-rendering the same report is a lookup.
+
         Args:
             report: AdvisoryReport
             profile: TaxProfile
@@ -83,168 +175,164 @@ class ReportGenerator:
         Returns:
             Markdown string
         """
-        lines = []
-
-        # Header
-        lines.append(f"# Tax Analysis Report - {report.tax_year}")
-        lines.append("")
-        lines.append(f"**Generated**: {report.generated_at.strftime('%B %d, %Y at %I:%M %p')}")
-        lines.append(f"**Report ID**: {report.report_id}")
-        lines.append(f"**Filing Status**: {profile.filing_status.upper()}")
+        payload = report.model_dump_json() + profile.model_dump_json(
+            include=_MARKDOWN_PROFILE_FIELDS
+        )
+        key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+        markdown = self._markdown_cache.get(key)
+        if markdown is not None:
+            self._markdown_cache.move_to_end(key)
+            return markdown
+
+        markdown = self._render_markdown(report, profile)
+        self._markdown_cache[key] = markdown
+        if len(self._markdown_cache) > MARKDOWN_CACHE_SIZE:
+            self._markdown_cache.popitem(last=False)
+        return markdown
+
+    def _render_markdown(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Render report as markdown (uncached)."""
+        return "".join(
+            build(self, report, profile)
+            for include, build in self._MARKDOWN_SECTIONS
+            if include is None or include(report)
+        )
+
+    def _markdown_header(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build report title and metadata lines."""
+        header = (
+            f"# Tax Analysis Report - {report.tax_year}\n\n"
+            f"**Generated**: {report.generated_at.strftime('%B %d, %Y at %I:%M %p')}\n"
+            f"**Report ID**: {report.report_id}\n"
+            f"**Filing Status**: {profile.filing_status.upper()}"
+        )
         if profile.state:
-            lines.append(f"**State**: {profile.state.upper()}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Executive Summary
-        lines.append("## Executive Summary")
-        lines.append("")
-        lines.append(report.executive_summary)
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Tax Liability Breakdown
-        lines.append("## Tax Liability Breakdown")
-        lines.append("")
-        calc = report.tax_calculation
+            header += f"\n**State**: {profile.state.upper()}"
+        return header + _SECTION_SEP
 
-        # Create table
-        lines.append("| Category              | Amount      |")
-        lines.append("|-----------------------|-------------|")
-        lines.append(f"| Total Income          | {self._format_money(profile.income.total_income)} |")
-
-        # Show breakdown if available
-        if "federal" in calc.breakdown and "agi" in calc.breakdown["federal"]:
-            agi_cents = calc.breakdown["federal"].get("agi", 0)
-            lines.append(f"| Adjusted Gross Income | {self._format_money_cents(agi_cents)} |")
-
-        if "federal" in calc.breakdown and "taxable_income" in calc.breakdown["federal"]:
-            taxable_cents = calc.breakdown["federal"].get("taxable_income", 0)
-            lines.append(f"| Taxable Income        | {self._format_money_cents(taxable_cents)} |")
-
-        lines.append(f"| Federal Tax           | {self._format_money(calc.federal_tax)} |")
-        lines.append(f"| State Tax             | {self._format_money(calc.state_tax)} |")
-        lines.append(f"| **Total Tax**         | **{self._format_money(calc.total_tax)}** |")
-        lines.append(f"| **Effective Rate**    | **{calc.effective_tax_rate:.1f}%** |")
-        lines.append(f"| **Marginal Rate**     | **{calc.marginal_tax_rate:.1f}%** |")
-        lines.append("")
-
-        # Confidence indicator
-        lines.append(f"*Confidence Level: {calc.confidence.upper()}*")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Top Optimization Strategies
-        if report.optimization_report.strategies:
-            lines.append("## Top Optimization Strategies")
-            lines.append("")
-            lines.append(
-                f"*Potential Total Savings: {self._format_money(report.optimization_report.total_potential_savings)}*"
-            )
-            lines.append("")
-
-            for i, strategy in enumerate(report.optimization_report.strategies[:5], 1):
-                emoji = "💰" if strategy.potential_savings.dollars >= 1000 else "💵"
-                lines.append(
-                    f"### {i}. {strategy.title} {emoji} Est. Savings: {self._format_money(strategy.potential_savings)}"
-                )
-                lines.append("")
-                lines.append(strategy.description)
-                lines.append("")
-
-                if strategy.action_steps:
-                    lines.append("**Action Steps**:")
-                    for step in strategy.action_steps:
-                        lines.append(f"- {step}")
-                    lines.append("")
-
-                if strategy.deadline:
-                    lines.append(f"**Deadline**: {strategy.deadline}")
-                    lines.append("")
-
-                effort_emoji = {"low": "🟢", "medium": "🟡", "high": "🔴"}.get(
-                    strategy.effort_level, "⚪"
-                )
-                lines.append(f"**Effort**: {effort_emoji} {strategy.effort_level.title()}")
-                lines.append("")
-
-                if strategy.risks_considerations:
-                    lines.append("**Considerations**:")
-                    for risk in strategy.risks_considerations:
-                        lines.append(f"- {risk}")
-                    lines.append("")
-
-                lines.append("---")
-                lines.append("")
-
-        # Missed Deductions
-        if report.deduction_finder_report.missed_deductions:
-            lines.append("## Potentially Missed Deductions")
-            lines.append("")
-            lines.append(
-                f"*Potential Total Savings: {self._format_money(report.deduction_finder_report.total_potential_savings)}*"
+    def _markdown_executive_summary(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build executive summary section."""
+        return _section("Executive Summary", report.executive_summary)
+
+    def _markdown_liability_table(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build tax liability table section with the confidence line."""
+        calc = report.tax_calculation
+        federal = calc.breakdown.get("federal", {})
+
+        rows = [
+            _LIABILITY_TABLE_HEADER,
+            f"| Total Income          | {self._format_money(profile.income.total_income)} |",
+        ]
+        if "agi" in federal:
+            rows.append(f"| Adjusted Gross Income | {_format_dollars(as_float(federal['agi']))} |")
+        if "taxable_income" in federal:
+            rows.append(
+                f"| Taxable Income        | {_format_dollars(as_float(federal['taxable_income']))} |"
             )
-            lines.append("")
-
-            for deduction in report.deduction_finder_report.missed_deductions[:5]:
-                likelihood_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(
-                    deduction.likelihood, "⚪"
-                )
-
-                lines.append(
-                    f"### {deduction.deduction_name} {likelihood_emoji} (Est. {self._format_money(deduction.estimated_value)})"
-                )
-                lines.append("")
-                lines.append(deduction.why_suggested)
-                lines.append("")
-
-                if deduction.follow_up_question:
-                    lines.append(f"**Question**: {deduction.follow_up_question}")
-                    lines.append("")
-
-                if deduction.requirements:
-                    lines.append("**Requirements**:")
-                    for req in deduction.requirements:
-                        lines.append(f"- {req}")
-                    lines.append("")
-
-                lines.append("---")
-                lines.append("")
-
-        # Action Plan
-        if report.top_recommendations:
-            lines.append("## Action Plan")
-            lines.append("")
-            for i, rec in enumerate(report.top_recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        # Assumptions (if any)
-        if calc.assumptions:
-            lines.append("## Assumptions")
-            lines.append("")
-            for assumption in calc.assumptions:
-                lines.append(f"- {assumption}")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        # Disclaimer
-        lines.append("## Disclaimer")
-        lines.append("")
-        lines.append(
-            "This analysis is for planning purposes only and does not constitute "
-            "professional tax advice. Tax laws are complex and subject to change. "
-            "Consult a licensed tax professional or CPA before making tax decisions."
+        rows += [
+            f"| Federal Tax           | {self._format_money(calc.federal_tax)} |",
+            f"| State Tax             | {self._format_money(calc.state_tax)} |",
+            f"| **Total Tax**         | **{self._format_money(calc.total_tax)}** |",
+            f"| **Effective Rate**    | **{calc.effective_tax_rate:.1f}%** |",
+            f"| **Marginal Rate**     | **{calc.marginal_tax_rate:.1f}%** |",
+            "",
+            f"*Confidence Level: {calc.confidence.upper()}*",
+        ]
+        return _section("Tax Liability Breakdown", "\n".join(rows))
+
+    def _markdown_strategies(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build optimization strategies section."""
+        optimizations = report.optimization_report
+        blocks = _SECTION_SEP.join(
+            self._markdown_strategy(i, strategy)
+            for i, strategy in enumerate(optimizations.strategies[:REPORT_MAX_ITEMS], 1)
+        )
+        return _section(
+            "Top Optimization Strategies",
+            f"*Potential Total Savings: {self._format_money(optimizations.total_potential_savings)}*"
+            f"\n\n{blocks}",
+        )
+
+    def _markdown_strategy(self, i: int, strategy: OptimizationStrategy) -> str:
+        """Build the markdown block for one optimization strategy."""
+        savings = strategy.potential_savings
+        return _STRATEGY_TEMPLATE.format(
+            i=i,
+            title=strategy.title,
+            money_emoji="💰" if savings.dollars >= 1000 else "💵",
+            savings=self._format_money(savings),
+            description=strategy.description,
+            action_block=_labeled_bullets("Action Steps", strategy.action_steps),
+            deadline_block=f"\n\n**Deadline**: {strategy.deadline}" if strategy.deadline else "",
+            effort_emoji=_EFFORT_EMOJI.get(strategy.effort_level, _DEFAULT_EMOJI),
+            effort=strategy.effort_level.title(),
+            risks_block=_labeled_bullets("Considerations", strategy.risks_considerations),
+        )
+
+    def _markdown_deductions(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build missed deductions section."""
+        missed_deductions = report.deduction_finder_report
+        blocks = _SECTION_SEP.join(
+            self._markdown_deduction(deduction)
+            for deduction in missed_deductions.missed_deductions[:REPORT_MAX_ITEMS]
+        )
+        return _section(
+            "Potentially Missed Deductions",
+            f"*Potential Total Savings: {self._format_money(missed_deductions.total_potential_savings)}*"
+            f"\n\n{blocks}",
+        )
+
+    def _markdown_deduction(self, deduction: MissedDeduction) -> str:
+        """Build the markdown block for one missed deduction."""
+        question = deduction.follow_up_question
+        return _DEDUCTION_TEMPLATE.format(
+            name=deduction.deduction_name,
+            likelihood_emoji=_LIKELIHOOD_EMOJI.get(deduction.likelihood, _DEFAULT_EMOJI),
+            value=self._format_money(deduction.estimated_value),
+            why=deduction.why_suggested,
+            question_block=f"\n\n**Question**: {question}" if question else "",
+            requirements_block=_labeled_bullets("Requirements", deduction.requirements),
         )
-        lines.append("")
 
-        return "\n".join(lines)
+    def _markdown_action_plan(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build numbered action plan section."""
+        steps = "\n".join(f"{i}. {rec}" for i, rec in enumerate(report.top_recommendations, 1))
+        return _section("Action Plan", steps)
+
+    def _markdown_assumptions(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build assumptions section."""
+        return _section("Assumptions", _bullets(report.tax_calculation.assumptions))
+
+    def _markdown_token_usage(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build token usage section with the prompt cache hit ratio."""
+        prompt_tokens = report.input_tokens + report.cache_read_tokens + report.cache_creation_tokens
+        hit_ratio = report.cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+        return _section(
+            "Token Usage",
+            f"- Prompt tokens: {prompt_tokens:,} "
+            f"({report.cache_read_tokens:,} cached, {report.cache_creation_tokens:,} cache writes)\n"
+            f"- Output tokens: {report.output_tokens:,}\n"
+            f"- Cache hit: {hit_ratio:.0%}",
+        )
+
+    def _markdown_disclaimer(self, report: AdvisoryReport, profile: TaxProfile) -> str:
+        """Build closing disclaimer section."""
+        return _DISCLAIMER_SECTION
+
+    # Markdown sections in render order, as (include predicate, builder).
+    # A None predicate means the section is always rendered.
+    _MARKDOWN_SECTIONS = (
+        (None, _markdown_header),
+        (None, _markdown_executive_summary),
+        (None, _markdown_liability_table),
+        (lambda report: bool(report.optimization_report.strategies), _markdown_strategies),
+        (lambda report: bool(report.deduction_finder_report.missed_deductions), _markdown_deductions),
+        (lambda report: bool(report.top_recommendations), _markdown_action_plan),
+        (lambda report: bool(report.tax_calculation.assumptions), _markdown_assumptions),
+        (lambda report: bool(report.input_tokens or report.cache_read_tokens), _markdown_token_usage),
+        (None, _markdown_disclaimer),
+    )
 
     def to_json(self, report: AdvisoryReport) -> str:
         """
@@ -256,7 +344,7 @@ class ReportGenerator:
         Returns:
             JSON string
         """
-        return json.dumps(report.to_dict(), indent=2)
+        return report.model_dump_json(indent=2)
 
     def _build_executive_summary(
         self,
@@ -270,34 +358,26 @@ class ReportGenerator:
             optimizations.total_potential_savings.dollars
             + missed_deductions.total_potential_savings.dollars
         )
+        if total_potential > 0:
+            outlook = _SAVINGS_OUTLOOK_TEMPLATE.format(savings=_format_dollars(total_potential))
+        else:
+            outlook = _WELL_OPTIMIZED_OUTLOOK
 
-        summary = (
-            f"Based on your {profile.tax_year} tax profile with an income of "
-            f"{self._format_money(profile.income.total_income)}, your estimated federal "
-            f"tax liability is {self._format_money(calculation.federal_tax)} "
-            f"({calculation.effective_tax_rate:.1f}% effective rate). "
-        )
-
+        state_sentence = ""
         if profile.state:
-            summary += (
+            state_sentence = (
                 f"Your estimated state tax for {profile.state.upper()} is "
                 f"{self._format_money(calculation.state_tax)}. "
             )
 
-        if total_potential > 0:
-            summary += (
-                f"\n\nWe've identified optimization strategies and potential deductions "
-                f"that could save you approximately {self._format_money_cents(total_potential)} "
-                f"in taxes. The recommendations below are prioritized by potential impact "
-                f"and ease of implementation."
-            )
-        else:
-            summary += (
-                f"\n\nYour tax situation appears well-optimized. We haven't identified "
-                f"significant additional tax-saving opportunities at this time."
-            )
-
-        return summary
+        return _EXECUTIVE_SUMMARY_TEMPLATE.format(
+            year=profile.tax_year,
+            income=self._format_money(profile.income.total_income),
+            federal=self._format_money(calculation.federal_tax),
+            rate=calculation.effective_tax_rate,
+            state_sentence=state_sentence,
+            outlook=outlook,
+        )
 
     def _build_top_recommendations(
         self,
@@ -321,10 +401,56 @@ class ReportGenerator:
 
         return recommendations[:3]
 
-    def _format_money(self, money) -> str:
+    def _format_money(self, money: Money) -> str:
         """Format Money object as string."""
-        return f"${money.to_dollars():,.2f}"
+        return _format_dollars(money.dollars)
+
+
+def _cap_optimizations(optimizations: OptimizationReport) -> OptimizationReport:
+    """Truncate to REPORT_MAX_ITEMS strategies, recomputing the savings total."""
+    if len(optimizations.strategies) <= REPORT_MAX_ITEMS:
+        return optimizations
+
+    kept = optimizations.strategies[:REPORT_MAX_ITEMS]
+    return optimizations.model_copy(
+        update={
+            "strategies": kept,
+            "total_potential_savings": Money(
+                dollars=sum(s.potential_savings.dollars for s in kept)
+            ),
+        }
+    )
+
+
+def _cap_deductions(missed_deductions: DeductionFinderReport) -> DeductionFinderReport:
+    """Truncate to REPORT_MAX_ITEMS deductions, recomputing totals and questions."""
+    if len(missed_deductions.missed_deductions) <= REPORT_MAX_ITEMS:
+        return missed_deductions
+
+    kept = missed_deductions.missed_deductions[:REPORT_MAX_ITEMS]
+    return missed_deductions.model_copy(
+        update={
+            "missed_deductions": kept,
+            "total_potential_savings": Money(
+                dollars=sum(d.estimated_value.dollars for d in kept)
+            ),
+            "follow_up_questions": [d.follow_up_question for d in kept if d.follow_up_question],
+        }
+    )
+
+
+def _bullets(items: list[str]) -> str:
+    """Render items as a markdown bullet list."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _labeled_bullets(label: str, items: list[str]) -> str:
+    """Render a bold label and bullet list after a blank line, or "" if items is empty."""
+    if not items:
+        return ""
+    return f"\n\n**{label}**:\n{_bullets(items)}"
+
 
-    def _format_money_cents(self, cents: int) -> str:
-        """Format cents as money string."""
-        return f"${cents / 100:,.2f}"
+def _section(title: str, body: str) -> str:
+    """Render a titled report section followed by a horizontal rule."""
+    return f"## {title}\n\n{body}{_SECTION_SEP}"
@@ -1,13 +1,35 @@
 """Tax Calculator Agent - calculates federal and state tax liability."""
 
 import asyncio
-from typing import Any
 import json
+import logging
+from typing import Any
 from tax_copilot.core.models import TaxProfile, Money
 from tax_copilot.agents.providers.base import LLMProvider, Message
+from tax_copilot.agents.cache import LLMCache, make_cache_key, profile_fingerprint
 from tax_copilot.agents.utils import parse_json_response
 from .models import TaxCalculation
-from .prompts import get_federal_tax_prompt, get_state_tax_prompt
+from .prompts import (
+    COMBINED_TAX_SCHEMA,
+    get_combined_tax_prompt,
+    get_federal_tax_prompt,
+    get_state_tax_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# States with no income tax on wages; their state tax is known without an LLM call
+NO_INCOME_TAX_STATES = frozenset({"AK", "FL", "NV", "NH", "SD", "TN", "TX", "WY", "WA"})
+
+# State codes (including missing/unknown) answered without asking the LLM
+_NO_LLM_STATES = NO_INCOME_TAX_STATES | {"", "UNKNOWN"}
+
+# Seconds to wait for an LLM tax calculation before using the rough estimate
+TAX_CALCULATION_TIMEOUT = 60.0
+
+# Confidence levels ranked low to high (unknown values count as medium)
+_CONFIDENCE_RANK = {"high": 3, "medium": 2, "low": 1}
+_CONFIDENCE_BY_RANK = ("", "low", "medium", "high")
 
 
 class TaxCalculator:
@@ -18,42 +40,81 @@ class TaxCalculator:
     No hardcoded tax brackets or rates - fully agentic approach.
     """
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, cache: LLMCache | None = None):
         """
         Initialize the tax calculator.
 
         Args:
             llm_provider: LLM provider for tax calculations
+            cache: Optional cache for parsed responses, keyed by profile
         """
         self.llm = llm_provider
+        self.cache = cache
 
-    async def calculate(self, profile: TaxProfile) -> TaxCalculation:
+    async def calculate(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None = None,
+    ) -> TaxCalculation:
         """
         Calculate federal and state tax liability.
 
         Args:
             profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
             TaxCalculation with federal, state, and total tax
         """
-        # Run federal and state calculations in parallel
-        federal_task = self._calculate_federal(profile)
-        state_task = self._calculate_state(profile)
-
-        federal_result, state_result = await asyncio.gather(
-            federal_task, state_task, return_exceptions=True
-        )
+        if profile_data is None:
+            profile_data = profile.to_prompt_dict()
+
+        # One LLM call for both federal and state tax when the state needs one;
+        # fall back to separate parallel calls if the combined call fails.
+        # Every LLM call is bounded by TAX_CALCULATION_TIMEOUT, after which the
+        # rough estimates below are used instead
+        combined_result = None
+        federal_result = state_result = None
+        if _state_code(profile) not in _NO_LLM_STATES:
+            try:
+                combined_result = await asyncio.wait_for(
+                    self._calculate_combined(profile, profile_data),
+                    timeout=TAX_CALCULATION_TIMEOUT,
+                )
+            except asyncio.TimeoutError as e:
+                # Retrying as two more calls would only add latency
+                logger.warning(
+                    "Combined tax calculation timed out after %ss, using estimates",
+                    TAX_CALCULATION_TIMEOUT,
+                )
+                federal_result = state_result = e
+            except Exception as e:
+                logger.warning("Combined tax calculation failed, using separate calls: %s", e)
+
+        if combined_result is not None:
+            federal_result, state_result = combined_result["federal"], combined_result["state"]
+        elif federal_result is None:
+            # Run federal and state calculations in parallel
+            federal_task = asyncio.wait_for(
+                self._calculate_federal(profile, profile_data), timeout=TAX_CALCULATION_TIMEOUT
+            )
+            state_task = asyncio.wait_for(
+                self._calculate_state(profile, profile_data), timeout=TAX_CALCULATION_TIMEOUT
+            )
+
+            federal_result, state_result = await asyncio.gather(
+                federal_task, state_task, return_exceptions=True
+            )
 
         # Handle errors gracefully
         if isinstance(federal_result, Exception):
-            print(f"Federal tax calculation failed: {federal_result}")
+            logger.warning("Federal tax calculation failed: %r", federal_result)
             federal_data = self._fallback_federal_calculation(profile)
         else:
             federal_data = federal_result
 
         if isinstance(state_result, Exception):
-            print(f"State tax calculation failed: {state_result}")
+            logger.warning("State tax calculation failed: %r", state_result)
             state_data = self._fallback_state_calculation(profile)
         else:
             state_data = state_result
@@ -93,17 +154,108 @@ class TaxCalculator:
             assumptions=assumptions,
         )
 
-    async def _calculate_federal(self, profile: TaxProfile) -> dict[str, Any]:
+    async def _calculate_combined(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate federal and state tax in a single LLM call.
+
+        Args:
+            profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Dictionary with "federal" and "state" tax data
+        """
+        if self.cache is None:
+            return await self._request_combined(profile, profile_data)
+
+        key = make_cache_key("combined_tax", profile_fingerprint(profile))
+        return await self.cache.get_or_compute(
+            key, lambda: self._request_combined(profile, profile_data)
+        )
+
+    async def _request_combined(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Request and validate the combined federal and state calculation.
+
+        Args:
+            profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Dictionary with "federal" and "state" tax data
+
+        Raises:
+            ValueError: If the response is not valid JSON of the expected shape
+        """
+        prompt = get_combined_tax_prompt(profile, profile_data)
+
+        response = await self.llm.generate(
+            messages=[
+                Message(
+                    role="user",
+                    content="Calculate the federal and state income tax based on the profile provided.",
+                )
+            ],
+            system_prompt=prompt,
+            response_schema=COMBINED_TAX_SCHEMA,
+            temperature=0.2,  # Low temperature for consistent calculations
+            max_tokens=3500,
+        )
+
+        data = parse_json_response(response.content)
+        for kind in ("federal", "state"):
+            if not isinstance(data.get(kind), dict):
+                raise ValueError(f"Combined response has missing or invalid '{kind}'")
+            _check_tax_result(data[kind], kind)
+        return data
+
+    async def _calculate_federal(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Calculate federal tax using LLM.
 
         Args:
             profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
             Dictionary with federal tax data
         """
-        prompt = get_federal_tax_prompt(profile)
+        if self.cache is None:
+            return await self._request_federal(profile, profile_data)
+
+        key = make_cache_key("federal_tax", profile_fingerprint(profile))
+        return await self.cache.get_or_compute(
+            key, lambda: self._request_federal(profile, profile_data)
+        )
+
+    async def _request_federal(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Request and validate the federal tax calculation from the LLM.
+
+        Args:
+            profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Dictionary with federal tax data
+        """
+        prompt = get_federal_tax_prompt(profile, profile_data)
 
         response = await self.llm.generate(
             messages=[
@@ -121,33 +273,57 @@ class TaxCalculator:
         try:
             data = parse_json_response(response.content)
 
-            # Validate data
-            if "federal_tax" not in data:
-                raise ValueError("Missing federal_tax in response")
-
-            # Ensure federal_tax is non-negative
-            if data["federal_tax"] < 0:
-                data["federal_tax"] = 0
-                data.setdefault("assumptions", []).append("Federal tax set to $0 (was negative)")
-
+            _check_tax_result(data, "federal")
             return data
 
         except json.JSONDecodeError as e:
-            print(f"Failed to parse federal tax JSON: {e}")
-            print(f"Response: {response.content}")
+            logger.warning("Failed to parse federal tax JSON: %s", e)
+            logger.debug("Federal tax response: %s", response.content)
             raise
 
-    async def _calculate_state(self, profile: TaxProfile) -> dict[str, Any]:
+    async def _calculate_state(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Calculate state tax using LLM.
 
         Args:
             profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
 
         Returns:
             Dictionary with state tax data
         """
-        prompt = get_state_tax_prompt(profile)
+        state = _state_code(profile)
+        if state in _NO_LLM_STATES:
+            return self._no_state_tax_result(state)
+
+        if self.cache is None:
+            return await self._request_state(profile, profile_data)
+
+        key = make_cache_key("state_tax", profile_fingerprint(profile))
+        return await self.cache.get_or_compute(
+            key, lambda: self._request_state(profile, profile_data)
+        )
+
+    async def _request_state(
+        self,
+        profile: TaxProfile,
+        profile_data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Request and validate the state tax calculation from the LLM.
+
+        Args:
+            profile: User's TaxProfile
+            profile_data: Precomputed profile.to_prompt_dict(), if available
+
+        Returns:
+            Dictionary with state tax data
+        """
+        prompt = get_state_tax_prompt(profile, profile_data)
 
         response = await self.llm.generate(
             messages=[
@@ -165,20 +341,12 @@ class TaxCalculator:
         try:
             data = parse_json_response(response.content)
 
-            # Validate data
-            if "state_tax" not in data:
-                raise ValueError("Missing state_tax in response")
-
-            # Ensure state_tax is non-negative
-            if data["state_tax"] < 0:
-                data["state_tax"] = 0
-                data.setdefault("assumptions", []).append("State tax set to $0 (was negative)")
-
+            _check_tax_result(data, "state")
             return data
 
         except json.JSONDecodeError as e:
-            print(f"Failed to parse state tax JSON: {e}")
-            print(f"Response: {response.content}")
+            logger.warning("Failed to parse state tax JSON: %s", e)
+            logger.debug("State tax response: %s", response.content)
             raise
 
     def _fallback_federal_calculation(self, profile: TaxProfile) -> dict[str, Any]:
@@ -233,6 +401,35 @@ class TaxCalculator:
             "confidence": "low",
         }
 
+    def _no_state_tax_result(self, state: str) -> dict[str, Any]:
+        """
+        Build the state tax result for a missing state or one without income tax.
+
+        These cases are deterministic, so no LLM call is made.
+
+        Args:
+            state: Upper-cased state code, or "" / "UNKNOWN" if not provided
+
+        Returns:
+            Dictionary with state tax data
+        """
+        if state in NO_INCOME_TAX_STATES:
+            return {
+                "state_tax": 0,
+                "has_income_tax": False,
+                "breakdown": {},
+                "assumptions": [f"{state} has no state income tax on wages"],
+                "confidence": "high",
+            }
+
+        return {
+            "state_tax": 0,
+            "has_income_tax": False,
+            "breakdown": {},
+            "assumptions": ["State not provided, cannot calculate state tax"],
+            "confidence": "low",
+        }
+
     def _merge_confidence(
         self,
         confidence1: str,
@@ -248,15 +445,32 @@ class TaxCalculator:
         Returns:
             Merged confidence level
         """
-        levels = {"high": 3, "medium": 2, "low": 1}
+        return _CONFIDENCE_BY_RANK[
+            min(_CONFIDENCE_RANK.get(confidence1, 2), _CONFIDENCE_RANK.get(confidence2, 2))
+        ]
+
 
-        level1 = levels.get(confidence1, 2)
-        level2 = levels.get(confidence2, 2)
+def _state_code(profile: TaxProfile) -> str:
+    """Normalize the profile's state to an upper-case code ("" if not provided)."""
+    return (profile.state or "").strip().upper()
 
-        min_level = min(level1, level2)
 
-        for name, value in levels.items():
-            if value == min_level:
-                return name
+def _check_tax_result(data: dict[str, Any], kind: str) -> None:
+    """
+    Validate a federal or state tax result in place.
 
-        return "medium"
+    Args:
+        data: Parsed tax result
+        kind: "federal" or "state"
+
+    Raises:
+        ValueError: If the tax amount is missing
+    """
+    field = f"{kind}_tax"
+    if field not in data:
+        raise ValueError(f"Missing {field} in response")
+
+    # Ensure the tax is non-negative
+    if data[field] < 0:
+        data[field] = 0
+        data.setdefault("assumptions", []).append(f"{kind.title()} tax set to $0 (was negative)")
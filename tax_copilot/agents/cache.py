@@ -0,0 +1,186 @@
+"""Exact-match cache for parsed LLM responses."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from pydantic_core import from_json, to_json
+
+from tax_copilot.core.models import TaxProfile
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a cached prompt changes so stale responses are not reused
+PROMPT_VERSION = "7"
+
+# Profile fields that describe how/when the profile was collected rather
+# than the taxpayer's situation; they don't change the LLM's answer
+_PROFILE_METADATA_FIELDS = {
+    "collected_via",
+    "session_id",
+    "confidence_scores",
+    "created_at",
+    "updated_at",
+}
+
+
+def profile_fingerprint(profile: TaxProfile) -> dict[str, Any]:
+    """
+    Get the parts of a profile that affect LLM output, for use in cache keys.
+
+    Args:
+        profile: TaxProfile
+
+    Returns:
+        JSON-compatible dict without collection metadata
+    """
+    return profile.model_dump(mode="json", exclude=_PROFILE_METADATA_FIELDS)
+
+
+def make_cache_key(tag: str, *parts: Any) -> str:
+    """
+    Build a cache key from a method tag and the inputs of the call.
+
+    Args:
+        tag: Name of the cached operation (e.g. "optimization")
+        *parts: JSON-serializable inputs the response depends on
+
+    Returns:
+        Hex digest key
+    """
+    payload = json.dumps(
+        [PROMPT_VERSION, tag, *parts], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class LLMCache:
+    """
+    Exact-match cache for parsed LLM JSON responses.
+
+    Keeps recent entries in an in-memory LRU and optionally persists them to
+    disk (one JSON file per key) for reuse across runs. Concurrent requests
+    for the same key share a single in-flight call.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted entries. If None, the cache
+                       is in-memory only.
+            maxsize: Maximum number of in-memory entries
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                value = from_json(path.read_bytes())
+            except (OSError, ValueError):
+                return None
+            self._remember(key, value)
+            return value
+
+        return None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_cache_key
+            value: Parsed JSON response
+        """
+        self._remember(key, value)
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(".tmp")
+            try:
+                tmp_path.write_bytes(to_json(value))
+                tmp_path.replace(path)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not persist cache entry %s: %s", key, e)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached response for key, computing it on a miss.
+
+        Failures are not cached; the exception propagates to every caller
+        waiting on the same key. A caller that is cancelled (e.g. by a
+        timeout) stops waiting without cancelling the shared computation, so
+        the other callers still get its result and it is still cached.
+
+        Args:
+            key: Cache key from make_cache_key
+            factory: Coroutine function producing the response
+
+        Returns:
+            Cached or freshly computed response
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(key, factory))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(task)
+
+    async def _compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run the factory and cache its result (inside the shared task)."""
+        value = await factory()
+        self.set(key, value)
+        return value
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished in-flight task."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every caller stopped waiting
+            task.exception()
+
+    def _remember(self, key: str, value: dict[str, Any]) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
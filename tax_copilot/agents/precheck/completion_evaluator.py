@@ -1,11 +1,12 @@
 """Completion Evaluator Agent - LLM-driven topic completion assessment."""
 
+from functools import lru_cache
 from typing import Literal, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from tax_copilot.core.conversation import Session, ConversationState
-from tax_copilot.agents.providers.base import LLMProvider, Message
-from tax_copilot.agents.utils import parse_json_response
+from tax_copilot.agents.providers.base import LLMProvider, LLMResponse, Message
+from tax_copilot.agents.utils import estimate_tokens, is_truncated_json, parse_json_response
 
 
 class CompletionEvaluation(BaseModel):
@@ -48,6 +49,17 @@ COMPLETION_EVALUATION_SCHEMA = {
     "required": ["topic_complete", "reasoning", "next_action", "confidence"],
 }
 
+# Formatted evaluator prompts kept for reuse
+COMPLETION_PROMPT_CACHE_SIZE = 64
+
+# Token budget for the recent conversation included in the prompt
+MAX_CONTEXT_TOKENS = 1500
+
+# Generation budgets: the JSON answer is ~100 tokens; the retry allows for a
+# verbose reasoning field
+EVALUATION_MAX_TOKENS = 200
+EVALUATION_RETRY_MAX_TOKENS = 500
+
 
 def get_completion_evaluator_prompt(
     tax_year: int,
@@ -60,6 +72,9 @@ def get_completion_evaluator_prompt(
     """
     Generate prompt for completion evaluator.
 
+    Prompts are memoized, so re-evaluating an unchanged session (retries,
+    repeated checks between user turns) reuses the formatted string.
+
     Args:
         tax_year: Tax year being discussed
         current_topic: Current topic being evaluated
@@ -71,6 +86,28 @@ def get_completion_evaluator_prompt(
     Returns:
         System prompt string
     """
+    return _completion_evaluator_prompt(
+        tax_year,
+        current_topic,
+        # Covered topics are a set in all but type; sort them so equal sets
+        # share a memoized prompt. Remaining topics keep interview order.
+        tuple(sorted(topics_covered)),
+        tuple(topics_remaining),
+        recent_conversation,
+        extracted_data_summary,
+    )
+
+
+@lru_cache(maxsize=COMPLETION_PROMPT_CACHE_SIZE)
+def _completion_evaluator_prompt(
+    tax_year: int,
+    current_topic: str,
+    topics_covered: tuple[str, ...],
+    topics_remaining: tuple[str, ...],
+    recent_conversation: str,
+    extracted_data_summary: str,
+) -> str:
+    """Format the completion evaluator prompt (hashable arguments for lru_cache)."""
     topics_covered_str = ", ".join(topics_covered) if topics_covered else "None yet"
     topics_remaining_str = ", ".join(topics_remaining) if topics_remaining else "None"
 
@@ -134,7 +171,7 @@ For **investments** topic, sufficient if:
 **Response Format (JSON):**
 {{
   "topic_complete": true/false,
-  "reasoning": "Brief explanation of your decision (1-2 sentences)",
+  "reasoning": "Brief explanation of your decision (one sentence, under 25 words)",
   "next_action": "continue_topic" | "advance_to_next_topic" | "complete_interview",
   "next_topic": "income" | "deductions" | "dependents" | "reviewing" | null,
   "confidence": "high" | "medium" | "low"
@@ -200,31 +237,31 @@ class CompletionEvaluator:
             CompletionEvaluation with decision and reasoning
 
         Raises:
-            Exception: If LLM call fails or returns invalid JSON
+            Exception: If the LLM call fails
         """
         # Build prompt with current context
         prompt = self._build_evaluation_prompt(session, current_topic)
 
-        # Call LLM with lower temperature for consistent decisions
+        # Call LLM with lower temperature for consistent decisions. The answer
+        # is a few short fields, so a tight token budget bounds decode time;
+        # retry once with more room if it got cut off. API errors (and
+        # cancellation) propagate to the caller.
+        response = await self._request_evaluation(prompt, EVALUATION_MAX_TOKENS)
+        if is_truncated_json(response.content):
+            response = await self._request_evaluation(prompt, EVALUATION_RETRY_MAX_TOKENS)
+
+        # Structured output is usually bare JSON, which pydantic parses and
+        # validates in one pass; only fall back to the lenient parser (code
+        # fences, formatted numbers) when that fails
         try:
-            response = await self.llm.generate(
-                messages=[
-                    Message(
-                        role="user",
-                        content="Evaluate if the current topic is complete based on the conversation.",
-                    )
-                ],
-                system_prompt=prompt,
-                response_schema=COMPLETION_EVALUATION_SCHEMA,
-                temperature=0.3,  # Lower temp for more deterministic decisions
-                max_tokens=500,
-            )
+            return CompletionEvaluation.model_validate_json(response.content)
+        except ValidationError:
+            pass
 
-            # Parse response
-            evaluation_data = parse_json_response(response.content)
-            return CompletionEvaluation(**evaluation_data)
+        try:
+            return CompletionEvaluation.model_validate(parse_json_response(response.content))
 
-        except Exception as e:
+        except (ValueError, TypeError, ValidationError) as e:
             # Fallback: assume not complete
             return CompletionEvaluation(
                 topic_complete=False,
@@ -233,14 +270,29 @@ class CompletionEvaluator:
                 confidence="low",
             )
 
-        except Exception as e:
-            # Fallback: assume not complete
-            return CompletionEvaluation(
-                topic_complete=False,
-                reasoning=f"Error during evaluation: {str(e)}",
-                next_action="continue_topic",
-                confidence="low",
-            )
+    async def _request_evaluation(self, prompt: str, max_tokens: int) -> LLMResponse:
+        """
+        Ask the LLM for a completion evaluation.
+
+        Args:
+            prompt: Evaluation system prompt
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Raw LLM response
+        """
+        return await self.llm.generate(
+            messages=[
+                Message(
+                    role="user",
+                    content="Evaluate if the current topic is complete based on the conversation.",
+                )
+            ],
+            system_prompt=prompt,
+            response_schema=COMPLETION_EVALUATION_SCHEMA,
+            temperature=0.3,  # Lower temp for more deterministic decisions
+            max_tokens=max_tokens,
+        )
 
     def _build_evaluation_prompt(
         self,
@@ -257,15 +309,25 @@ class CompletionEvaluator:
         Returns:
             Formatted prompt string
         """
-        # Get recent conversation (last 10 exchanges)
+        # Get recent conversation (last 10 exchanges), newest first, until the
+        # token budget is spent so long messages can't blow up the prompt
         recent_messages = session.get_recent_messages(count=20)
         conversation_lines = []
+        budget = MAX_CONTEXT_TOKENS
 
-        for msg in recent_messages:
+        for msg in reversed(recent_messages):
             role = "Agent" if msg.role == "agent" else "User"
-            conversation_lines.append(f"{role}: {msg.content}")
-
-        recent_conversation = "\n".join(conversation_lines)
+            line = f"{role}: {msg.content}"
+            tokens = estimate_tokens(line)
+            if tokens > budget:
+                if not conversation_lines:
+                    # Always keep (the start of) the latest message
+                    conversation_lines.append(line[: budget * 4] + "…")
+                break
+            conversation_lines.append(line)
+            budget -= tokens
+
+        recent_conversation = "\n".join(reversed(conversation_lines))
 
         # Summarize extracted data
         extracted_data = session.extracted_data
@@ -1,12 +1,17 @@
 """Conversation manager - orchestrates dialog flow and state transitions."""
 
-from typing import Any
+import asyncio
+import re
+from types import MappingProxyType
+from typing import Any, Literal
 import json
+from pydantic import BaseModel, ValidationError, field_validator
+
 from tax_copilot.core.conversation import Session, ConversationState
 from tax_copilot.agents.providers.base import LLMProvider, Message
 from tax_copilot.agents.storage.session_store import SessionStore
 from tax_copilot.agents.storage.profile_builder import ProfileBuilder
-from tax_copilot.agents.utils import parse_json_response
+from tax_copilot.agents.utils import as_choice, parse_json_response
 from .prompts import (
     get_system_prompt,
     get_topic_transition_prompt,
@@ -16,6 +21,101 @@ from .prompts import (
 from .completion_evaluator import CompletionEvaluator, CompletionEvaluation
 
 
+# Most recent messages sent to the LLM each turn. Interviews rarely get this
+# long, so the history usually grows append-only and keeps its cached prefix
+# instead of sliding (and invalidating the cache) every turn
+HISTORY_MESSAGE_LIMIT = 100
+
+# Phrases that confirm a summary; matched as whole words, case-insensitively
+_CONFIRMATION_PHRASES = (
+    "yes",
+    "yeah",
+    "yep",
+    "correct",
+    "right",
+    "accurate",
+    "looks good",
+    "that's right",
+    "that's correct",
+    "confirmed",
+    "confirm",
+)
+_CONFIRMATION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _CONFIRMATION_PHRASES)) + r")\b",
+    re.IGNORECASE,
+)
+
+
+_NEXT_ACTIONS = ("continue_topic", "advance_to_next_topic", "complete_interview")
+
+
+class LLMTurnResponse(BaseModel):
+    """One interview turn from the LLM (see EXTRACTION_SCHEMA)."""
+
+    next_question: str = ""
+    extracted_data: dict[str, Any] | None = None
+    confidence: Literal["high", "medium", "low"] = "medium"
+    reasoning: str = ""
+
+    # Topic completion decision, made in the same call
+    topic_complete: bool | None = None
+    next_action: Literal["continue_topic", "advance_to_next_topic", "complete_interview"] | None = None
+    next_topic: str | None = None
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _default_confidence(cls, value: Any) -> str:
+        """Treat a missing or unexpected confidence level as medium."""
+        return as_choice(value, ("high", "medium", "low"), "medium")
+
+    @field_validator("next_action", mode="before")
+    @classmethod
+    def _unknown_action(cls, value: Any) -> str | None:
+        """Treat an unexpected next_action as missing."""
+        return as_choice(value, _NEXT_ACTIONS, None)
+
+    def completion_evaluation(self) -> CompletionEvaluation | None:
+        """
+        Get the topic completion decision from this turn.
+
+        Returns:
+            CompletionEvaluation, or None if the LLM left the decision out
+        """
+        if self.topic_complete is None or self.next_action is None:
+            return None
+        return CompletionEvaluation(
+            topic_complete=self.topic_complete,
+            reasoning=self.reasoning,
+            next_action=self.next_action,
+            next_topic=self.next_topic,
+            confidence=self.confidence,
+        )
+
+    @classmethod
+    def parse(cls, content: str) -> "LLMTurnResponse":
+        """
+        Parse and validate a raw LLM response.
+
+        Structured output is usually bare JSON, which pydantic parses and
+        validates in one pass; the lenient parser (code fences, formatted
+        numbers) is only used when that fails.
+
+        Args:
+            content: Raw response text
+
+        Returns:
+            Validated turn response
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            ValidationError: If the JSON doesn't match the expected shape
+        """
+        try:
+            return cls.model_validate_json(content)
+        except ValidationError:
+            return cls.model_validate(parse_json_response(content))
+
+
 class ConversationManager:
     """
     Manages the conversation flow for tax interviews.
@@ -27,8 +127,11 @@ class ConversationManager:
     - Determining when to move between topics
     """
 
+    # One manager is built per turn; slots keep instances small
+    __slots__ = ("session", "llm", "storage", "profile_builder", "completion_evaluator")
+
     # Mapping of states to topics
-    STATE_TO_TOPIC = {
+    STATE_TO_TOPIC = MappingProxyType({
         ConversationState.STARTED: "getting_started",
         ConversationState.COLLECTING_BASIC_INFO: "basic_info",
         ConversationState.COLLECTING_INCOME: "income",
@@ -36,26 +139,29 @@ class ConversationManager:
         ConversationState.COLLECTING_DEPENDENTS: "dependents",
         ConversationState.COLLECTING_INVESTMENTS: "investments",
         ConversationState.COMPLETED: "completed",
-    }
+    })
 
     # State transition order
-    STATE_SEQUENCE = [
+    STATE_SEQUENCE = (
         ConversationState.STARTED,
         ConversationState.COLLECTING_BASIC_INFO,
         ConversationState.COLLECTING_INCOME,
         ConversationState.COLLECTING_DEDUCTIONS,
         ConversationState.COLLECTING_DEPENDENTS,
         ConversationState.COMPLETED,
-    ]
+    )
+
+    # Each state's successor in STATE_SEQUENCE
+    _NEXT_STATE = MappingProxyType(dict(zip(STATE_SEQUENCE, STATE_SEQUENCE[1:])))
 
     # Reverse mapping: topic to state
-    TOPIC_TO_STATE = {
+    TOPIC_TO_STATE = MappingProxyType({
         "basic_info": ConversationState.COLLECTING_BASIC_INFO,
         "income": ConversationState.COLLECTING_INCOME,
         "deductions": ConversationState.COLLECTING_DEDUCTIONS,
         "dependents": ConversationState.COLLECTING_DEPENDENTS,
-        "investments": ConversationState.COLLECTING_INVESTMENTS
-    }
+        "investments": ConversationState.COLLECTING_INVESTMENTS,
+    })
 
     def __init__(
         self,
@@ -85,10 +191,13 @@ class ConversationManager:
 
         Steps:
         1. Add user message to session
-        2. Check if state transition needed (BEFORE generating next question)
-        3. Generate LLM response based on (possibly updated) topic
-        4. Parse LLM response (extract data + next question)
-        5. Update session with extracted data
+        2. Generate LLM response (next question, extracted data, and whether
+           the current topic is complete)
+        3. Update session with extracted data
+        4. Apply the state transition, if any (if the separate evaluator
+           made that decision and changed the topic, the next question is
+           regenerated for the new topic)
+        5. Add agent's next question to session
         6. Save session to disk
         7. Return agent's next question
 
@@ -101,29 +210,49 @@ class ConversationManager:
         # Step 1: Add user message to session
         self.session.add_message("user", user_message)
 
-        # Step 2: Check state transition BEFORE generating next question
-        # This ensures the next question is based on the correct (updated) topic
-        await self._check_state_transition()
-
-        # Step 3: Generate response from LLM (based on updated state)
+        # Step 2: Generate response from LLM for the current topic. The same
+        # call decides whether the topic is complete (and, if so, asks about
+        # the next one), so a turn is a single round trip
+        current_topic = self.STATE_TO_TOPIC.get(self.session.state, "unknown")
         try:
-            llm_response = await self._generate_llm_response()
+            llm_response = await self._generate_llm_response(current_topic)
 
             # Parse structured response
-            response_data = parse_json_response(llm_response.content)
+            turn = LLMTurnResponse.parse(llm_response.content)
 
-            next_question = response_data.get("next_question", "")
-            extracted_data = response_data.get("extracted_data")
-            confidence = response_data.get("confidence", "medium")
+            next_question = turn.next_question
+            extracted_data = turn.extracted_data
+            confidence = turn.confidence
 
-            # Step 4: Update session with extracted data
+            # Step 3: Update session with data from the user's answer, under
+            # the topic they were answering
             if extracted_data:
-                current_topic = self.STATE_TO_TOPIC.get(
-                    self.session.state, "unknown"
-                )
                 # Nest data under topic
                 self.session.update_extracted_data({current_topic: extracted_data})
 
+            # Step 4: Apply the completion decision (asks the separate
+            # evaluator if the response didn't include one)
+            evaluation = turn.completion_evaluation()
+            if evaluation is not None:
+                await self._check_state_transition(evaluation)
+            else:
+                state_before = self.session.state
+                covered_before = list(self.session.topics_covered)
+                await self._check_state_transition()
+
+                # The question above was written for the previous topic; if
+                # the evaluator moved on, ask about the new topic instead so
+                # the next question always matches the updated state
+                if (
+                    self.session.state != state_before
+                    or self.session.topics_covered != covered_before
+                ):
+                    current_topic = self.STATE_TO_TOPIC.get(self.session.state, "unknown")
+                    llm_response = await self._generate_llm_response(current_topic)
+                    followup = LLMTurnResponse.parse(llm_response.content)
+                    next_question = followup.next_question
+                    confidence = followup.confidence
+
             # Step 5: Add agent message to session
             self.session.add_message(
                 "agent",
@@ -131,19 +260,19 @@ class ConversationManager:
                 metadata={"confidence": confidence},
             )
 
-            # Step 6: Save session
-            self.storage.save_session(self.session)
+            # Step 6: Save session (appends the new messages when nothing else changed)
+            await self._save_session()
 
             return next_question
 
-        except json.JSONDecodeError as e:
-            # Fallback if LLM doesn't return valid JSON
+        except (json.JSONDecodeError, ValidationError) as e:
+            # Fallback if LLM doesn't return valid JSON of the expected shape
             fallback_response = (
                 "I apologize, I had trouble processing that. "
                 "Could you please rephrase your response?"
             )
             self.session.add_message("agent", fallback_response)
-            self.storage.save_session(self.session)
+            await self._save_session()
             return fallback_response
 
         except Exception as e:
@@ -153,37 +282,41 @@ class ConversationManager:
                 "Let's continue - could you tell me more?"
             )
             self.session.add_message("agent", error_response)
-            self.storage.save_session(self.session)
+            await self._save_session()
             return error_response
 
-    async def _generate_llm_response(self) -> Any:
+    async def _save_session(self) -> None:
+        """
+        Persist the session without blocking the event loop.
+
+        The write runs in a worker thread, so other sessions' LLM calls keep
+        making progress during disk I/O; it is still awaited, so the turn
+        only returns once its messages are on disk.
+        """
+        await asyncio.to_thread(self.storage.save_session_changes, self.session)
+
+    async def _generate_llm_response(self, current_topic: str) -> Any:
         """
         Generate LLM response based on current conversation state.
 
+        Args:
+            current_topic: Topic of the current conversation state
+
         Returns:
             LLMResponse object
         """
         # Build conversation history for LLM
-        messages = []
-
-        # Get recent messages (last 20 for context window management)
-        recent_messages = self.session.get_recent_messages(count=100)
-
-        for msg in recent_messages:
-            if msg.role in ["user", "assistant", "agent"]:
-                messages.append(
-                    Message(
-                        role=msg.role if msg.role == "user" else "assistant",
-                        content=msg.content,
-                    )
-                )
+        messages = [
+            Message(role=role, content=content)
+            for role, content in self.session.get_llm_history(count=HISTORY_MESSAGE_LIMIT)
+        ]
 
         # Build system prompt based on current state
-        current_topic = self.STATE_TO_TOPIC.get(self.session.state, "general")
         system_prompt = get_system_prompt(
             tax_year=self.session.tax_year,
             current_topic=current_topic,
             topics_covered=self.session.topics_covered,
+            topics_remaining=self.session.topics_remaining,
         )
 
         # Generate response with structured output
@@ -196,12 +329,19 @@ class ConversationManager:
 
         return response
 
-    async def _check_state_transition(self) -> None:
+    async def _check_state_transition(
+        self,
+        evaluation: CompletionEvaluation | None = None,
+    ) -> None:
         """
         Check if enough information collected to transition to next state.
 
-        Uses LLM-based CompletionEvaluator for intelligent assessment.
-        Updates session state if transition should occur.
+        Uses the completion decision from the interview turn when given,
+        otherwise asks the LLM-based CompletionEvaluator. Updates session
+        state if transition should occur.
+
+        Args:
+            evaluation: Completion decision already made for this turn, if any
         """
         current_state = self.session.state
         current_topic = self.STATE_TO_TOPIC.get(current_state)
@@ -212,13 +352,14 @@ class ConversationManager:
 
         # Use CompletionEvaluator to assess if topic is complete
         try:
-            evaluation = await self.completion_evaluator.evaluate(
-                session=self.session,
-                current_topic=current_topic,
-            )
+            if evaluation is None:
+                evaluation = await self.completion_evaluator.evaluate(
+                    session=self.session,
+                    current_topic=current_topic,
+                )
 
             # Handle evaluation result
-            await self._handle_evaluation(evaluation)
+            await self._handle_evaluation(evaluation, current_topic)
 
             if len(self.session.topics_remaining) == 0 and evaluation.topic_complete:
                 # Ready to complete the interview
@@ -229,15 +370,19 @@ class ConversationManager:
             print(f"Completion evaluation failed: {e}")
             return
 
-    async def _handle_evaluation(self, evaluation: CompletionEvaluation) -> None:
+    async def _handle_evaluation(
+        self,
+        evaluation: CompletionEvaluation,
+        current_topic: str | None,
+    ) -> None:
         """
         Handle the completion evaluation result.
 
         Args:
             evaluation: CompletionEvaluation from the evaluator
+            current_topic: Topic that was evaluated
         """
         current_state = self.session.state
-        current_topic = self.STATE_TO_TOPIC.get(current_state)
 
         if evaluation.next_action == "complete_interview":
             # Ready to complete the interview
@@ -277,16 +422,9 @@ class ConversationManager:
             current_state: Current conversation state
 
         Returns:
-            Next state, or None if already at end
+            Next state, or None if already at end (or not in the sequence)
         """
-        try:
-            current_index = self.STATE_SEQUENCE.index(current_state)
-            if current_index < len(self.STATE_SEQUENCE) - 1:
-                return self.STATE_SEQUENCE[current_index + 1]
-        except ValueError:
-            pass
-
-        return None
+        return self._NEXT_STATE.get(current_state)
 
     def _is_confirmation(self, message: str) -> bool:
         """
@@ -298,20 +436,4 @@ class ConversationManager:
         Returns:
             True if message indicates confirmation
         """
-        message_lower = message.lower().strip()
-
-        confirmations = [
-            "yes",
-            "yeah",
-            "yep",
-            "correct",
-            "right",
-            "accurate",
-            "looks good",
-            "that's right",
-            "that's correct",
-            "confirmed",
-            "confirm",
-        ]
-
-        return any(conf in message_lower for conf in confirmations)
+        return _CONFIRMATION_PATTERN.search(message) is not None
@@ -1,11 +1,16 @@
 """Data Organizer Agent - Reorganizes extracted data into proper topic buckets."""
 
+import copy
 from typing import Any
 
 import json
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from pydantic_core import to_json
+
 from tax_copilot.core.conversation import Session
-from tax_copilot.agents.providers.base import LLMProvider, Message
-from tax_copilot.agents.utils import parse_json_response
+from tax_copilot.agents.cache import LLMCache, make_cache_key
+from tax_copilot.agents.providers.base import LLMProvider, Message, SystemPrompt
+from tax_copilot.agents.utils import is_truncated_json, parse_json_response
 
 
 # JSON Schema for organized data output
@@ -33,33 +38,109 @@ ORGANIZED_DATA_SCHEMA = {
 }
 
 
-def get_data_organizer_prompt(
-    raw_extracted_data: dict[str, Any],
-    conversation_summary: str,
-) -> str:
+# Output budget for the organizer. Organized profiles are typically a few
+# hundred tokens; a response cut off at the limit is retried once with the
+# larger budget
+ORGANIZER_MAX_TOKENS = 800
+ORGANIZER_RETRY_MAX_TOKENS = 2000
+
+# Raw data longer than this (in characters, when indented) is sent compactly
+# and without PII fields, to bound the organizer's prompt size
+ORGANIZER_RAW_DATA_MAX_CHARS = 8000
+
+# Extracted fields the organizer must drop anyway (see the privacy note in
+# its instructions); removed up front when the raw data is too large
+_PII_FIELDS = frozenset({
+    "name",
+    "first_name",
+    "last_name",
+    "full_name",
+    "taxpayer_name",
+    "spouse_name",
+    "ssn",
+    "taxpayer_ssn",
+    "spouse_ssn",
+    "dob",
+    "date_of_birth",
+    "birth_date",
+    "address",
+    "street_address",
+    "phone",
+    "phone_number",
+    "email",
+})
+
+
+def _without_pii(data: Any) -> Any:
     """
-    Generate prompt for data organizer.
+    Return a copy of extracted data with PII fields removed at any depth.
 
     Args:
-        raw_extracted_data: Raw data that may be misorganized
-        conversation_summary: Brief summary of conversation topics
+        data: Extracted data (dicts, lists, and scalars)
 
     Returns:
-        System prompt string
+        Data without keys in _PII_FIELDS
+    """
+    if isinstance(data, dict):
+        return {
+            key: _without_pii(value)
+            for key, value in data.items()
+            if str(key).lower() not in _PII_FIELDS
+        }
+    if isinstance(data, list):
+        return [_without_pii(item) for item in data]
+    return data
+
+
+class OrganizedData(BaseModel):
     """
-    # Format raw data for prompt
-    raw_data_str = json.dumps(raw_extracted_data, indent=2)
+    Organizer response (see ORGANIZED_DATA_SCHEMA).
 
-    return f"""You are organizing tax interview data into the correct categories.
+    The validator is built once, when the class is defined, so checking a
+    response doesn't re-walk the schema. Missing or null topics become empty
+    dicts; extra topics are kept as-is.
+    """
 
-**Raw Extracted Data (may have data in wrong topics):**
-{raw_data_str}
+    model_config = ConfigDict(extra="allow")
 
-**Conversation Summary:**
-{conversation_summary}
+    basic_info: dict[str, Any] = {}
+    income: dict[str, Any] = {}
+    deductions: dict[str, Any] = {}
+    dependents: dict[str, Any] = {}
+
+    @field_validator("basic_info", "income", "deductions", "dependents", mode="before")
+    @classmethod
+    def _empty_topic(cls, value: Any) -> Any:
+        """Treat a null topic as empty."""
+        return {} if value is None else value
+
+    @classmethod
+    def parse(cls, content: str) -> "OrganizedData":
+        """
+        Parse and validate a raw organizer response.
+
+        Args:
+            content: Raw response text
+
+        Returns:
+            Validated organized data
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            ValidationError: If a topic is not an object
+        """
+        try:
+            return cls.model_validate_json(content)
+        except ValidationError:
+            return cls.model_validate(parse_json_response(content))
+
+
+# Instructions shared by every organize call; only the data appended after
+# them changes, so providers can cache this prefix
+DATA_ORGANIZER_INSTRUCTIONS = """You are organizing tax interview data into the correct categories.
 
 **Your Task:**
-Reorganize this data into the standard tax profile structure with these EXACT topic keys:
+Reorganize the raw extracted data (given at the end) into the standard tax profile structure with these EXACT topic keys:
 - basic_info
 - income
 - deductions
@@ -123,27 +204,27 @@ If PII appears in the raw data, EXCLUDE it from the organized output.
 - Personal info (names, SSN) belongs in "basic_info"
 
 **Response Format (JSON):**
-{{
-  "basic_info": {{
+{
+  "basic_info": {
     "filing_status": "...",
     "state": "..."
-  }},
-  "income": {{
+  },
+  "income": {
     "total_income": 70000,
     "employment_income": 70000,
     "w2_count": 1,
     "investment_income": 20000,
     "rental_income": 5000
-  }},
-  "deductions": {{
+  },
+  "deductions": {
     "charitable_contributions": 13250
-  }},
-  "dependents": {{
+  },
+  "dependents": {
     "count": 0,
     "ages": [],
     "claiming_child_tax_credit": false
-  }}
-}}
+  }
+}
 
 **Important:**
 - Return ONLY the JSON object, nothing else
@@ -151,8 +232,37 @@ If PII appears in the raw data, EXCLUDE it from the organized output.
 - Use consistent field names as specified above
 - Remove verbose/redundant fields that don't fit the schema
 
-Respond with JSON only.
-"""
+Respond with JSON only."""
+
+
+def get_data_organizer_prompt(
+    raw_extracted_data: dict[str, Any],
+    conversation_summary: str,
+) -> SystemPrompt:
+    """
+    Generate prompt for data organizer.
+
+    Args:
+        raw_extracted_data: Raw data that may be misorganized
+        conversation_summary: Brief summary of conversation topics
+
+    Returns:
+        SystemPrompt with the fixed instructions and the session's data
+    """
+    # Format raw data for prompt; oversized data is trimmed of fields the
+    # organizer would drop and sent without indentation
+    raw_data_str = to_json(raw_extracted_data, indent=2).decode()
+    if len(raw_data_str) > ORGANIZER_RAW_DATA_MAX_CHARS:
+        raw_data_str = to_json(_without_pii(raw_extracted_data)).decode()
+
+    return SystemPrompt(
+        static=DATA_ORGANIZER_INSTRUCTIONS,
+        dynamic=f"""**Raw Extracted Data (may have data in wrong topics):**
+{raw_data_str}
+
+**Conversation Summary:**
+{conversation_summary}""",
+    )
 
 
 class DataOrganizer:
@@ -163,14 +273,16 @@ class DataOrganizer:
     or uses inconsistent field names.
     """
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self, llm_provider: LLMProvider, cache: LLMCache | None = None):
         """
         Initialize the data organizer.
 
         Args:
             llm_provider: LLM provider for reorganization decisions
+            cache: Optional cache for organized data, keyed by the prompt
         """
         self.llm = llm_provider
+        self.cache = cache
 
     async def organize(
         self,
@@ -191,32 +303,19 @@ class DataOrganizer:
         # Build prompt with current data
         prompt = self._build_organizer_prompt(session)
 
-        # Call LLM to reorganize
+        # Call LLM to reorganize, unless the same data was already organized
         try:
-            response = await self.llm.generate(
-                messages=[
-                    Message(
-                        role="user",
-                        content="Reorganize the extracted tax data into the correct structure.",
-                    )
-                ],
-                system_prompt=prompt,
-                response_schema=ORGANIZED_DATA_SCHEMA,
-                temperature=0.2,  # Low temp for consistent reorganization
-                max_tokens=2000,
-            )
+            if self.cache is None:
+                return await self._request(prompt)
 
-            # Parse and return organized data
-            organized_data = parse_json_response(response.content)
+            key = make_cache_key("data_organizer", prompt.cache_key)
+            organized_data = await self.cache.get_or_compute(key, lambda: self._request(prompt))
 
-            # Ensure all required keys exist
-            for key in ["basic_info", "income", "deductions", "dependents"]:
-                if key not in organized_data:
-                    organized_data[key] = {}
+            # The result becomes the session's extracted_data, which is
+            # updated in place; keep the cached entry out of reach
+            return copy.deepcopy(organized_data)
 
-            return organized_data
-
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValidationError) as e:
             # Fallback: return original data structure
             print(f"Failed to parse organized data: {e}")
             return session.extracted_data
@@ -226,7 +325,47 @@ class DataOrganizer:
             print(f"Error during data organization: {e}")
             return session.extracted_data
 
-    def _build_organizer_prompt(self, session: Session) -> str:
+    async def _request(self, prompt: SystemPrompt) -> dict[str, Any]:
+        """
+        Ask the LLM to reorganize the data in the prompt.
+
+        Args:
+            prompt: Organizer prompt with the session's data
+
+        Returns:
+            Organized data with all four topic keys
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            ValidationError: If a topic in the response is not an object
+        """
+        messages = [
+            Message(
+                role="user",
+                content="Reorganize the extracted tax data into the correct structure.",
+            )
+        ]
+
+        response = await self.llm.generate(
+            messages=messages,
+            system_prompt=prompt,
+            response_schema=ORGANIZED_DATA_SCHEMA,
+            temperature=0.0,  # Deterministic reorganization
+            max_tokens=ORGANIZER_MAX_TOKENS,
+        )
+        if is_truncated_json(response.content):
+            response = await self.llm.generate(
+                messages=messages,
+                system_prompt=prompt,
+                response_schema=ORGANIZED_DATA_SCHEMA,
+                temperature=0.0,
+                max_tokens=ORGANIZER_RETRY_MAX_TOKENS,
+            )
+
+        # Parse and validate; all four topic keys are filled in
+        return OrganizedData.parse(response.content).model_dump()
+
+    def _build_organizer_prompt(self, session: Session) -> SystemPrompt:
         """
         Build the organizer prompt with session data.
 
@@ -234,7 +373,7 @@ class DataOrganizer:
             session: Current session
 
         Returns:
-            Formatted prompt string
+            SystemPrompt for the organize call
         """
         # Get raw extracted data
         raw_data = session.extracted_data
@@ -1,22 +1,50 @@
 """Prompt templates and schemas for the Dynamic Questioning Agent."""
 
+from functools import lru_cache
 from typing import Any
 
+from tax_copilot.agents.providers.base import SystemPrompt
 
-def get_system_prompt(tax_year: int, current_topic: str, topics_covered: list[str]) -> str:
+
+def get_system_prompt(
+    tax_year: int,
+    current_topic: str,
+    topics_covered: list[str],
+    topics_remaining: list[str] | None = None,
+) -> SystemPrompt:
     """
     Generate the system prompt for the tax interview agent.
 
+    The instructions depend only on the tax year and stay byte-identical
+    across turns, so providers can cache them; the interview status that
+    changes every turn goes in the dynamic tail.
+
     Args:
         tax_year: Tax year being discussed
         current_topic: The current topic being covered
         topics_covered: List of topics already covered
+        topics_remaining: List of topics still to cover, in interview order
 
     Returns:
-        System prompt string
+        SystemPrompt with the static instructions and per-turn status
+    """
+    return SystemPrompt(
+        static=get_static_system_prompt(tax_year),
+        dynamic=get_dynamic_context(current_topic, topics_covered, topics_remaining),
+    )
+
+
+@lru_cache(maxsize=8)
+def get_static_system_prompt(tax_year: int) -> str:
     """
-    topics_str = ", ".join(topics_covered) if topics_covered else "none yet"
+    Generate the per-session instructions of the interview system prompt.
 
+    Args:
+        tax_year: Tax year being discussed
+
+    Returns:
+        Static system prompt string
+    """
     return f"""You are a friendly, knowledgeable tax preparation assistant conducting a HIGH-LEVEL tax planning interview. Your goal is to collect tax information from the user for their {tax_year} tax return to provide advisory guidance.
 
 **Your Role:**
@@ -51,22 +79,31 @@ This is a HIGH-LEVEL tax planning tool, not a tax filing system. Focus on:
 6. **Be empathetic** - Validate concerns and provide reassurance when appropriate
 7. **Respect privacy** - NEVER ask for PII (names, SSN, DOB, addresses)
 
-**Current Status:**
-- Current topic: {current_topic}
-- Topics already covered: {topics_str}
-
 **Important:**
 - After EACH user response, extract structured data (numbers, booleans, categories) in JSON format
 - Mark your confidence level for each extracted piece of data
 - If user says something like "around $2,000" or "about 3 months", extract the number but note the uncertainty
 - If user volunteers PII, acknowledge but do NOT store it in extracted_data
 
+**Topic Completion:**
+After each answer, also decide whether the CURRENT topic now has sufficient information:
+- **basic_info**: Filing status is known (state of residence is optional)
+- **income**: Primary income sources and amounts are known (W-2, self-employed, investments), and the user has indicated there is no other income
+- **deductions**: Major deductions (charitable, mortgage, student loans) are known, OR the user said they have none or declined the common ones
+- **dependents**: Whether the user has dependents is known; if yes, their count and ages
+- **investments**: Investments were already covered with income, OR the user has none
+Treat "no other income", "that's all", "no more", "none", "N/A" or a "no" to a follow-up as completion signals, and don't ask for more detail than a tax preparer needs for high-level planning.
+If the topic is complete, advance: make "next_question" the first question about the next topic (or a closing summary question if no topics remain).
+
 **Response Format:**
-Provide your response as JSON with two fields:
+Provide your response as JSON with these fields:
 1. "next_question": Your next question to the user (conversational, friendly)
 2. "extracted_data": Structured data from their last answer (use null if nothing to extract)
-3. "confidence": Your confidence in the extracted data ("high", "medium", "low")
+3. "confidence": Your confidence in the extracted data and completion decision ("high", "medium", "low")
 4. "reasoning": Brief explanation of what you learned and why you're asking this next question
+5. "topic_complete": Whether the current topic has sufficient information (true/false)
+6. "next_action": "continue_topic", "advance_to_next_topic", or "complete_interview" (when no topics remain)
+7. "next_topic": If advancing, the topic your next question is about ("basic_info", "income", "deductions", "dependents", "investments"); otherwise null
 
 Example response:
 {{
@@ -76,10 +113,41 @@ Example response:
     "has_multiple_employers": true
   }},
   "confidence": "high",
-  "reasoning": "User mentioned two companies. Need to understand if simultaneous employment or job change to properly assess income reporting and potential signing bonuses."
+  "reasoning": "User mentioned two companies. Need to understand if simultaneous employment or job change to properly assess income reporting and potential signing bonuses.",
+  "topic_complete": false,
+  "next_action": "continue_topic",
+  "next_topic": null
 }}"""
 
 
+def get_dynamic_context(
+    current_topic: str,
+    topics_covered: list[str],
+    topics_remaining: list[str] | None = None,
+) -> str:
+    """
+    Generate the per-turn interview status for the system prompt.
+
+    Args:
+        current_topic: The current topic being covered
+        topics_covered: List of topics already covered
+        topics_remaining: List of topics still to cover, in interview order
+
+    Returns:
+        Status block string
+    """
+    # Sorted so the same set of covered topics always renders the same text,
+    # whatever order they were covered in
+    topics_str = ", ".join(sorted(topics_covered)) if topics_covered else "none yet"
+    remaining_str = ", ".join(topics_remaining) if topics_remaining else "none"
+
+    return f"""**Current Status:**
+- Current topic: {current_topic}
+- Topics already covered: {topics_str}
+- Topics remaining: {remaining_str}"""
+
+
+@lru_cache(maxsize=8)
 def get_opening_question_prompt(tax_year: int) -> str:
     """
     Generate prompt for the opening question of the interview.
@@ -98,18 +166,12 @@ This is a tax planning consultation tool, not a tax filing system.
 
 Generate a warm, welcoming opening question to begin collecting basic tax information. Start with the user's filing status.
 
-Provide your response as JSON with:
-1. "next_question": A friendly opening question about their filing status (single, married filing jointly, etc.)
-2. "extracted_data": null (no data yet)
-3. "confidence": "high"
-4. "reasoning": Brief explanation of why this is the right starting point
+Respond with ONLY a JSON object with one field:
+- "next_question": A friendly opening question about their filing status (single, married filing jointly, etc.)
 
 Example response:
 {{
-  "next_question": "Hi! I'm here to help you review your {tax_year} tax information. Let's start with the basics - what's your filing status? Are you filing as single, married filing jointly, married filing separately, or head of household?",
-  "extracted_data": null,
-  "confidence": "high",
-  "reasoning": "Filing status is the most fundamental piece of information and affects all other tax calculations, so it's the logical starting point."
+  "next_question": "Hi! I'm here to help you review your {tax_year} tax information. Let's start with the basics - what's your filing status? Are you filing as single, married filing jointly, married filing separately, or head of household?"
 }}"""
 
 
@@ -206,6 +268,19 @@ EXTRACTION_SCHEMA = {
             "type": "string",
             "description": "Brief explanation of what was learned and why asking this next question",
         },
+        "topic_complete": {
+            "type": "boolean",
+            "description": "Whether the current topic has sufficient information",
+        },
+        "next_action": {
+            "type": "string",
+            "enum": ["continue_topic", "advance_to_next_topic", "complete_interview"],
+            "description": "What should happen next",
+        },
+        "next_topic": {
+            "type": ["string", "null"],
+            "description": "If advancing, which topic the next question is about",
+        },
     },
     "required": ["next_question", "extracted_data", "confidence", "reasoning"],
 }
@@ -1,19 +1,34 @@
 """Questioning Agent - High-level orchestrator for tax interviews."""
 
+import asyncio
+import hashlib
+import weakref
 from typing import Any
 from datetime import datetime
+from pathlib import Path
 
 from tax_copilot.core.conversation import Session, ConversationState
 from tax_copilot.core.models import TaxProfile
 from tax_copilot.agents.providers.base import LLMProvider, Message
+from tax_copilot.agents.cache import LLMCache, make_cache_key
 from tax_copilot.agents.storage.session_store import SessionStore
 from tax_copilot.agents.storage.profile_builder import ProfileBuilder
 from tax_copilot.agents.utils import parse_json_response
 from .conversation_manager import ConversationManager
-from .prompts import get_opening_question_prompt, EXTRACTION_SCHEMA
+from .prompts import get_opening_question_prompt
 from .data_organizer import DataOrganizer
 
 
+# Opening question for new interviews, and the fallback when an LLM-generated
+# one is requested but can't be produced
+OPENING_QUESTION = (
+    "Hi! I'm here to help collect your {tax_year} tax information. "
+    "Let's start with the basics - what's your filing status? "
+    "Are you filing as single, married filing jointly, married filing separately, "
+    "or head of household?"
+)
+
+
 class QuestioningAgent:
     """
     High-level orchestrator for dynamic tax questioning.
@@ -30,6 +45,8 @@ class QuestioningAgent:
         llm_provider: LLMProvider,
         storage: SessionStore | None = None,
         profile_builder: ProfileBuilder | None = None,
+        cache: LLMCache | None = None,
+        llm_opening_question: bool = False,
     ):
         """
         Initialize the questioning agent.
@@ -38,11 +55,26 @@ class QuestioningAgent:
             llm_provider: LLM provider for generating questions
             storage: Session storage (creates default if None)
             profile_builder: Profile builder (creates default if None)
+            cache: Cache for opening-question and organizer responses. If
+                   None, uses a cache persisted in ~/.tax_copilot/cache
+            llm_opening_question: If True, have the LLM word the opening
+                                  question instead of using OPENING_QUESTION
         """
         self.llm = llm_provider
         self.storage = storage or SessionStore()
         self.profile_builder = profile_builder or ProfileBuilder()
-        self.data_organizer = DataOrganizer(llm_provider)
+        self.cache = cache or LLMCache(Path.home() / ".tax_copilot" / "cache")
+        self.data_organizer = DataOrganizer(llm_provider, cache=self.cache)
+        self.llm_opening_question = llm_opening_question
+
+        # One lock per active session, so turns of the same interview run one
+        # at a time; entries disappear once no turn holds them
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # In-flight turns by (session_id, message digest), so a resent message
+        # (double submit, client retry) joins the running turn
+        self._in_flight_turns: dict[tuple[str, str], asyncio.Task] = {}
 
     async def start_interview(
         self,
@@ -67,8 +99,12 @@ class QuestioningAgent:
         # Transition to basic info collection
         session.transition_state(ConversationState.COLLECTING_BASIC_INFO)
 
-        # Generate opening question
-        first_question = await self._generate_opening_question(tax_year)
+        # Opening question. It always asks for the filing status, so the fixed
+        # wording is used unless an LLM-worded one was requested
+        if self.llm_opening_question:
+            first_question = await self._generate_opening_question(tax_year)
+        else:
+            first_question = OPENING_QUESTION.format(tax_year=tax_year)
 
         # Add opening question to session
         session.add_message("agent", first_question)
@@ -89,6 +125,11 @@ class QuestioningAgent:
         """
         Continue an existing interview with user's response.
 
+        Turns of the same session are processed one at a time. If the same
+        response arrives again while it is still being processed, the
+        duplicate waits for and returns the same result instead of being
+        processed twice.
+
         Args:
             session_id: ID of session to continue
             user_response: User's response to previous question
@@ -100,6 +141,58 @@ class QuestioningAgent:
                 - profile: TaxProfile if complete, None otherwise
                 - session_state: Current conversation state
         """
+        digest = hashlib.blake2b(user_response.encode(), digest_size=8).hexdigest()
+        key = (session_id, digest)
+
+        # Every caller (including the first) waits through a shield, so one
+        # that disconnects doesn't cancel the turn for the others or midway
+        # through its save
+        task = self._in_flight_turns.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._continue_interview(session_id, user_response))
+            self._in_flight_turns[key] = task
+            task.add_done_callback(lambda done: self._finish_turn(key, done))
+
+        return await asyncio.shield(task)
+
+    async def _continue_interview(
+        self,
+        session_id: str,
+        user_response: str,
+    ) -> dict[str, Any]:
+        """
+        Process one interview turn while holding the session's lock.
+
+        Args:
+            session_id: ID of session to continue
+            user_response: User's response to previous question
+
+        Returns:
+            Same dict as continue_interview
+        """
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = self._session_locks[session_id] = asyncio.Lock()
+
+        async with lock:
+            return await self._process_turn(session_id, user_response)
+
+    async def _process_turn(
+        self,
+        session_id: str,
+        user_response: str,
+    ) -> dict[str, Any]:
+        """
+        Load the session, process the user's response, and finish the
+        interview if it is complete.
+
+        Args:
+            session_id: ID of session to continue
+            user_response: User's response to previous question
+
+        Returns:
+            Same dict as continue_interview
+        """
         # Load session
         try:
             session = self.storage.load_session(session_id)
@@ -135,13 +228,15 @@ class QuestioningAgent:
 
                 # Update session with organized data
                 session.extracted_data = organized_data
-                self.storage.save_session(session)
 
-                # Step 2: Build profile from organized data
-                profile = self.profile_builder.build_from_session(session)
-
-                # Step 3: Save profile to disk
-                self.profile_builder.save_profile(profile, user_id=session.user_id)
+                # Steps 2-3: Save the session, and build the profile from the
+                # organized data and save it. Both only read the session, so
+                # they run side by side in worker threads instead of blocking
+                # the event loop one after the other
+                _, profile = await asyncio.gather(
+                    asyncio.to_thread(self.storage.save_session, session),
+                    asyncio.to_thread(self._build_and_save_profile, session),
+                )
 
             except Exception as e:
                 # If profile building fails, mark as error but don't crash
@@ -174,8 +269,10 @@ class QuestioningAgent:
                 - session_state: Current state
                 - messages_count: Number of messages in conversation
         """
+        # The summary sidecar has everything needed here, so the message
+        # history isn't loaded
         try:
-            session = self.storage.load_session(session_id)
+            summary = self.storage.load_session_summary(session_id)
         except FileNotFoundError:
             return {
                 "error": "Session not found",
@@ -183,19 +280,15 @@ class QuestioningAgent:
             }
 
         # Get last agent message
-        last_question = "Let's continue where we left off."
-        for msg in reversed(session.messages):
-            if msg.role == "agent":
-                last_question = msg.content
-                break
+        last_question = summary.last_agent_message or "Let's continue where we left off."
 
         return {
-            "user_id": session.user_id,
-            "session_id": session.session_id,
+            "user_id": summary.user_id,
+            "session_id": summary.session_id,
             "last_question": last_question,
-            "session_state": session.state.value,
-            "messages_count": len(session.messages),
-            "tax_year": session.tax_year,
+            "session_state": summary.state.value,
+            "messages_count": summary.messages_count,
+            "tax_year": summary.tax_year,
         }
 
     def list_sessions(
@@ -213,7 +306,7 @@ class QuestioningAgent:
         Returns:
             List of session summaries
         """
-        sessions = self.storage.list_sessions(user_id=user_id, tax_year=tax_year)
+        sessions = self.storage.list_session_summaries(user_id=user_id, tax_year=tax_year)
 
         summaries = []
         for session in sessions:
@@ -224,7 +317,7 @@ class QuestioningAgent:
                 "state": session.state.value,
                 "created_at": session.created_at.isoformat(),
                 "updated_at": session.updated_at.isoformat(),
-                "messages_count": len(session.messages),
+                "messages_count": session.messages_count,
             })
 
         return summaries
@@ -266,12 +359,39 @@ class QuestioningAgent:
         """
         Generate the opening question for a new interview.
 
+        The opening question depends only on the tax year, so the response is
+        cached and reused for every interview of that year.
+
         Args:
             tax_year: Tax year
 
         Returns:
             Opening question string
         """
+        try:
+            key = make_cache_key("opening_question", tax_year)
+            response_data = await self.cache.get_or_compute(
+                key, lambda: self._request_opening_question(tax_year)
+            )
+            return response_data["next_question"]
+
+        except Exception:
+            # Fallback opening question
+            return OPENING_QUESTION.format(tax_year=tax_year)
+
+    async def _request_opening_question(self, tax_year: int) -> dict[str, Any]:
+        """
+        Request the opening question from the LLM.
+
+        Args:
+            tax_year: Tax year
+
+        Returns:
+            Parsed response with a non-empty "next_question"
+
+        Raises:
+            ValueError: If the response is not JSON with a next_question
+        """
         prompt = get_opening_question_prompt(tax_year)
 
         messages = [
@@ -281,26 +401,37 @@ class QuestioningAgent:
             )
         ]
 
-        try:
-            response = await self.llm.generate(
-                messages=messages,
-                system_prompt=prompt,
-                response_schema=EXTRACTION_SCHEMA,
-                temperature=0.7,
-            )
+        # The prompt spells out the one-field format, so the full interview
+        # schema isn't sent
+        response = await self.llm.generate(
+            messages=messages,
+            system_prompt=prompt,
+            temperature=0.7,
+        )
 
-            response_data = parse_json_response(response.content)
-            return response_data.get(
-                "next_question",
-                f"Hi! Let's get started on your {tax_year} tax information. "
-                "What's your filing status?",
-            )
+        response_data = parse_json_response(response.content)
+        if not isinstance(response_data.get("next_question"), str) or not response_data["next_question"]:
+            raise ValueError("Opening question response has no next_question")
+        return response_data
 
-        except Exception:
-            # Fallback opening question
-            return (
-                f"Hi! I'm here to help collect your {tax_year} tax information. "
-                "Let's start with the basics - what's your filing status? "
-                "Are you filing as single, married filing jointly, married filing separately, "
-                "or head of household?"
-            )
+    def _finish_turn(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        """Forget a finished in-flight turn."""
+        if self._in_flight_turns.get(key) is task:
+            del self._in_flight_turns[key]
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every caller stopped waiting
+            task.exception()
+
+    def _build_and_save_profile(self, session: Session) -> TaxProfile:
+        """
+        Build the final profile from a completed session and save it to disk.
+
+        Args:
+            session: Completed session with organized extracted_data
+
+        Returns:
+            Saved TaxProfile
+        """
+        profile = self.profile_builder.build_from_session(session)
+        self.profile_builder.save_profile(profile, user_id=session.user_id)
+        return profile
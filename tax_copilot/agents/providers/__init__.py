@@ -1,15 +1,21 @@
 """LLM Provider Abstraction Layer."""
 
-from .base import LLMProvider, LLMResponse, Message
+import os
+
+from .base import LLMProvider, LLMResponse, Message, SystemPrompt, track_usage
 from .anthropic_provider import AnthropicProvider
 from .openai_provider import OpenAIProvider
+from .limited_provider import ConcurrencyLimitedProvider, DEFAULT_MAX_CONCURRENCY
 
 __all__ = [
     "LLMProvider",
     "LLMResponse",
     "Message",
+    "SystemPrompt",
+    "track_usage",
     "AnthropicProvider",
     "OpenAIProvider",
+    "ConcurrencyLimitedProvider",
 ]
 
 
@@ -17,6 +23,7 @@ def create_provider(
     provider_name: str = "openai",
     api_key: str | None = None,
     model: str | None = None,
+    max_concurrency: int | None = None,
 ) -> LLMProvider:
     """
     Factory function to create LLM provider instances.
@@ -25,6 +32,9 @@ def create_provider(
         provider_name: Name of the provider ('anthropic' or 'openai')
         api_key: API key for the provider (if None, loads from environment)
         model: Model name (if None, uses provider default)
+        max_concurrency: Maximum simultaneous requests across all providers
+                         created here (if None, reads LLM_MAX_CONCURRENCY from
+                         environment, default 10)
 
     Returns:
         LLMProvider instance
@@ -33,11 +43,20 @@ def create_provider(
         ValueError: If provider_name is not supported
     """
     if provider_name.lower() == "anthropic":
-        return AnthropicProvider(api_key=api_key, model=model)
+        provider = AnthropicProvider(api_key=api_key, model=model)
     elif provider_name.lower() == "openai":
-        return OpenAIProvider(api_key=api_key, model=model)
+        provider = OpenAIProvider(api_key=api_key, model=model)
     else:
         raise ValueError(
             f"Unsupported provider: {provider_name}. "
             f"Supported providers: 'anthropic', 'openai'"
         )
+
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    # All providers created here share one cap on in-flight requests
+    return ConcurrencyLimitedProvider(
+        provider,
+        max_concurrency=max_concurrency,
+        shared=True,
+    )
@@ -1,11 +1,23 @@
 """Anthropic Claude LLM provider implementation."""
 
 import os
-import json
 from typing import Any
-from anthropic import Anthropic, AsyncAnthropic
+from anthropic import AsyncAnthropic
 
-from .base import LLMProvider, LLMResponse, Message
+from tax_copilot.agents.utils import estimate_tokens
+from .base import (
+    LLMProvider,
+    LLMResponse,
+    Message,
+    SystemPrompt,
+    format_schema,
+    record_usage,
+)
+
+# Shortest prefix Anthropic will cache; shorter cache_control blocks are
+# ignored but still billed at the cache-write rate
+CACHE_MIN_TOKENS = 1024
+HAIKU_CACHE_MIN_TOKENS = 2048
 
 
 class AnthropicProvider(LLMProvider):
@@ -35,12 +47,15 @@ class AnthropicProvider(LLMProvider):
             )
 
         self.model = model or os.getenv("DEFAULT_MODEL", "claude-3-5-sonnet-20241022")
+        # One client per provider: its HTTP connection pool is kept alive and
+        # shared by every agent holding this provider, including concurrent
+        # calls fanned out with asyncio.gather
         self.client = AsyncAnthropic(api_key=self.api_key)
 
     async def generate(
         self,
         messages: list[Message],
-        system_prompt: str | None = None,
+        system_prompt: str | SystemPrompt | None = None,
         response_schema: dict[str, Any] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
@@ -50,7 +65,10 @@ class AnthropicProvider(LLMProvider):
 
         Args:
             messages: List of conversation messages
-            system_prompt: Optional system prompt
+            system_prompt: Optional system prompt. A SystemPrompt's static part
+                           is sent as a separate block marked for prompt caching
+                           when it is long enough to be cached. Multi-turn
+                           histories are cached up to their last message.
             response_schema: Optional JSON schema for structured output
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
@@ -79,23 +97,53 @@ class AnthropicProvider(LLMProvider):
             "temperature": temperature,
         }
 
-        # Add system prompt if provided
-        if system_prompt:
-            request_params["system"] = system_prompt
-
         # Handle structured output if schema provided
         # Note: Anthropic doesn't have native JSON schema enforcement yet,
         # so we append instructions to system prompt
         if response_schema:
             schema_instruction = (
                 f"\n\nYou must respond with valid JSON matching this schema:\n"
-                f"{json.dumps(response_schema, indent=2)}\n"
+                f"{format_schema(response_schema)}\n"
                 f"Your entire response should be valid JSON, nothing else."
             )
-            if "system" in request_params:
-                request_params["system"] += schema_instruction
+            if isinstance(system_prompt, SystemPrompt):
+                # Keep the schema inside the cached prefix
+                system_prompt = system_prompt.with_static_suffix(schema_instruction)
+            elif system_prompt:
+                system_prompt += schema_instruction
             else:
-                request_params["system"] = schema_instruction.strip()
+                system_prompt = schema_instruction.strip()
+
+        # Add system prompt if provided
+        if isinstance(system_prompt, SystemPrompt) and self._should_cache(system_prompt.static):
+            # Cache everything up to the end of the static prefix
+            system_blocks = [
+                {
+                    "type": "text",
+                    "text": system_prompt.static,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            if system_prompt.dynamic:
+                system_blocks.append({"type": "text", "text": system_prompt.dynamic})
+            request_params["system"] = system_blocks
+        elif system_prompt:
+            request_params["system"] = str(system_prompt)
+
+        # In a multi-turn conversation, also put a cache breakpoint on the
+        # last message: the next turn resends the same history plus one
+        # exchange, so everything up to here is read back from the cache
+        if len(anthropic_messages) > 1 and self._should_cache(
+            str(system_prompt or "") + "".join(m["content"] for m in anthropic_messages)
+        ):
+            last = anthropic_messages[-1]
+            last["content"] = [
+                {
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
 
         # Make API call
         try:
@@ -107,20 +155,39 @@ class AnthropicProvider(LLMProvider):
                 if block.type == "text":
                     content += block.text
 
+            # input_tokens excludes tokens read from or written to the cache
+            usage = {
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens,
+                "cache_read_input_tokens": response.usage.cache_read_input_tokens or 0,
+                "cache_creation_input_tokens": response.usage.cache_creation_input_tokens or 0,
+            }
+            record_usage(usage)
+
             # Build response object
             return LLMResponse(
                 content=content.strip(),
                 model=response.model,
-                usage={
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                },
+                usage=usage,
                 raw_response=response,
             )
 
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}") from e
 
+    def _should_cache(self, text: str) -> bool:
+        """
+        Check whether a prompt prefix is long enough to be cached by the model.
+
+        Args:
+            text: Static prompt prefix
+
+        Returns:
+            True if the prefix meets the model's minimum cacheable length
+        """
+        min_tokens = HAIKU_CACHE_MIN_TOKENS if "haiku" in self.model else CACHE_MIN_TOKENS
+        return estimate_tokens(text) >= min_tokens
+
     def get_model_name(self) -> str:
         """Return the name of the Claude model being used."""
         return self.model
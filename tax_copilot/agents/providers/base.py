@@ -1,8 +1,13 @@
 """Abstract base class for LLM providers."""
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Literal
-from pydantic import BaseModel
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, lru_cache
+from typing import Any, Iterator, Literal
+from pydantic import BaseModel, ConfigDict
 
 
 class Message(BaseModel):
@@ -12,6 +17,129 @@ class Message(BaseModel):
     content: str
 
 
+class SystemPrompt(BaseModel):
+    """
+    System prompt split into a static prefix and a per-call dynamic tail.
+
+    Providers with explicit prompt caching (Anthropic) mark the end of the
+    static part as a cache breakpoint; others send the joined text, which
+    still benefits from automatic prefix caching.
+
+    The static_hash and cache_key digests let callers key client-side
+    response caches without re-hashing the prompt text themselves.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    static: str
+    dynamic: str = ""
+
+    @cached_property
+    def static_hash(self) -> str:
+        """Digest of the static part (shared by every call using the same preamble)."""
+        return _digest(self.static)
+
+    @cached_property
+    def cache_key(self) -> str:
+        """Digest identifying the full prompt."""
+        return hashlib.blake2b(
+            f"{self.static_hash}:{self.dynamic}".encode(), digest_size=16
+        ).hexdigest()
+
+    def as_string(self) -> str:
+        """Return the full prompt text."""
+        if not self.dynamic:
+            return self.static
+        return f"{self.static}\n\n{self.dynamic}"
+
+    def with_static_suffix(self, text: str) -> "SystemPrompt":
+        """
+        Return a copy with text appended to the static part.
+
+        Args:
+            text: Static text to append (e.g. schema instructions)
+
+        Returns:
+            New SystemPrompt
+        """
+        return SystemPrompt(static=self.static + text, dynamic=self.dynamic)
+
+    def __str__(self) -> str:
+        return self.as_string()
+
+
+@lru_cache(maxsize=32)
+def _digest(text: str) -> str:
+    """Hash prompt text; static preambles are few, so their digests are memoized."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+# Serialized response schemas keyed by id(); the schema is kept alongside so
+# its id can't be reused by another object
+_schema_json: dict[int, tuple[dict[str, Any], str]] = {}
+
+
+def format_schema(schema: dict[str, Any]) -> str:
+    """
+    Serialize a response schema for inclusion in a prompt.
+
+    Schemas are module-level constants passed on every call, so each one is
+    serialized once and reused. Schemas must not be mutated after first use.
+
+    Args:
+        schema: JSON schema dict
+
+    Returns:
+        Indented JSON text of the schema
+    """
+    entry = _schema_json.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = (schema, json.dumps(schema, indent=2))
+        _schema_json[id(schema)] = entry
+    return entry[1]
+
+
+# Token totals for the innermost active track_usage() block, if any
+_usage_totals: ContextVar[dict[str, int] | None] = ContextVar("usage_totals", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[dict[str, int]]:
+    """
+    Sum token usage of every LLM call made inside the block.
+
+    Tasks started inside the block (e.g. via asyncio.gather) inherit the
+    context and add to the same totals.
+
+    Yields:
+        Dict of usage key (input_tokens, output_tokens,
+        cache_read_input_tokens, cache_creation_input_tokens) to total tokens
+    """
+    totals: dict[str, int] = {}
+    token = _usage_totals.set(totals)
+    try:
+        yield totals
+    finally:
+        _usage_totals.reset(token)
+
+
+def record_usage(usage: dict[str, int] | None) -> None:
+    """
+    Add one call's usage to the active track_usage() totals.
+
+    Providers call this for every completed request; it is a no-op when no
+    tracking block is active.
+
+    Args:
+        usage: Usage dict from an LLMResponse
+    """
+    totals = _usage_totals.get()
+    if totals is None or not usage:
+        return
+    for key, value in usage.items():
+        totals[key] = totals.get(key, 0) + value
+
+
 class LLMResponse(BaseModel):
     """Response from an LLM provider."""
 
@@ -33,7 +161,7 @@ class LLMProvider(ABC):
     async def generate(
         self,
         messages: list[Message],
-        system_prompt: str | None = None,
+        system_prompt: str | SystemPrompt | None = None,
         response_schema: dict[str, Any] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
@@ -43,7 +171,8 @@ class LLMProvider(ABC):
 
         Args:
             messages: List of conversation messages
-            system_prompt: Optional system prompt to set context
+            system_prompt: Optional system prompt to set context, either a
+                           string or a SystemPrompt with a cacheable prefix
             response_schema: Optional JSON schema for structured output
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
@@ -60,3 +189,8 @@ class LLMProvider(ABC):
     def get_model_name(self) -> str:
         """Return the name of the model being used."""
         pass
+
+    @property
+    def provider_name(self) -> str:
+        """Name of the backend provider (its class name), e.g. for report metadata."""
+        return type(self).__name__
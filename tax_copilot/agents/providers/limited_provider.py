@@ -0,0 +1,144 @@
+"""Concurrency-limited wrapper around an LLM provider."""
+
+import asyncio
+from typing import Any
+
+from .base import LLMProvider, LLMResponse, Message, SystemPrompt
+
+# Default cap on simultaneous in-flight LLM requests
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Semaphores shared by every provider create_provider builds, by event loop
+# and limit. A semaphore only works within the loop it was first used in, so
+# each loop (e.g. each asyncio.run) gets its own
+_shared_semaphores: dict[tuple[asyncio.AbstractEventLoop, int], asyncio.Semaphore] = {}
+
+
+def _loop_semaphore(
+    semaphores: dict[tuple[asyncio.AbstractEventLoop, int], asyncio.Semaphore],
+    max_concurrency: int,
+) -> asyncio.Semaphore:
+    """
+    Get (or create) the running event loop's semaphore in a table.
+
+    Entries for loops that have since closed are dropped whenever a new one
+    is added, so the table doesn't grow with every asyncio.run.
+
+    Args:
+        semaphores: Table of semaphores by (event loop, limit)
+        max_concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        Semaphore for the running loop and limit
+    """
+    key = (asyncio.get_running_loop(), max_concurrency)
+    semaphore = semaphores.get(key)
+    if semaphore is None:
+        for stale in [k for k in semaphores if k[0].is_closed()]:
+            del semaphores[stale]
+        semaphore = semaphores[key] = asyncio.Semaphore(max_concurrency)
+    return semaphore
+
+
+def shared_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    """
+    Get the running event loop's shared semaphore for a concurrency limit.
+
+    Must be called from a coroutine.
+
+    Args:
+        max_concurrency: Maximum number of simultaneous requests
+
+    Returns:
+        Semaphore shared by all callers in this loop asking for the same limit
+    """
+    return _loop_semaphore(_shared_semaphores, max_concurrency)
+
+
+class ConcurrencyLimitedProvider(LLMProvider):
+    """
+    LLM provider that caps how many requests are in flight at once.
+
+    Agents fan calls out with asyncio.gather, and several sessions may share
+    one provider (or several providers one semaphore); the cap keeps bursts
+    under the API's rate limits instead of failing them with 429s. Callers
+    are unchanged: each still awaits its own generate() call, which simply
+    waits for a free slot.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        shared: bool = False,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: Provider that makes the actual API calls
+            max_concurrency: Maximum number of simultaneous requests
+            shared: If True, the cap applies to all shared providers with
+                    the same limit together (see shared_semaphore); otherwise
+                    this provider has its own
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.shared = shared
+
+        # Own semaphores by event loop, created on first use in each loop
+        self._semaphores: dict[tuple[asyncio.AbstractEventLoop, int], asyncio.Semaphore] = {}
+
+    async def generate(
+        self,
+        messages: list[Message],
+        system_prompt: str | SystemPrompt | None = None,
+        response_schema: dict[str, Any] | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> LLMResponse:
+        """
+        Generate a completion once a request slot is free.
+
+        Args:
+            messages: List of conversation messages
+            system_prompt: Optional system prompt to set context
+            response_schema: Optional JSON schema for structured output
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            LLMResponse from the wrapped provider
+
+        Raises:
+            Exception: If the API call fails
+        """
+        async with self._get_semaphore():
+            return await self.provider.generate(
+                messages=messages,
+                system_prompt=system_prompt,
+                response_schema=response_schema,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+    def get_model_name(self) -> str:
+        """Return the name of the wrapped provider's model."""
+        return self.provider.get_model_name()
+
+    @property
+    def provider_name(self) -> str:
+        """Name of the wrapped provider."""
+        return self.provider.provider_name
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore for the running event loop."""
+        if self.shared:
+            return shared_semaphore(self.max_concurrency)
+        return _loop_semaphore(self._semaphores, self.max_concurrency)
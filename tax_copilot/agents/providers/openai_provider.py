@@ -1,11 +1,17 @@
 """OpenAI GPT LLM provider implementation."""
 
 import os
-import json
 from typing import Any
 from openai import AsyncOpenAI
 
-from .base import LLMProvider, LLMResponse, Message
+from .base import (
+    LLMProvider,
+    LLMResponse,
+    Message,
+    SystemPrompt,
+    format_schema,
+    record_usage,
+)
 
 
 class OpenAIProvider(LLMProvider):
@@ -35,12 +41,15 @@ class OpenAIProvider(LLMProvider):
             )
 
         self.model = model or "gpt-4o"
+        # One client per provider: its HTTP connection pool is kept alive and
+        # shared by every agent holding this provider, including concurrent
+        # calls fanned out with asyncio.gather
         self.client = AsyncOpenAI(api_key=self.api_key)
 
     async def generate(
         self,
         messages: list[Message],
-        system_prompt: str | None = None,
+        system_prompt: str | SystemPrompt | None = None,
         response_schema: dict[str, Any] | None = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
@@ -50,7 +59,7 @@ class OpenAIProvider(LLMProvider):
 
         Args:
             messages: List of conversation messages
-            system_prompt: Optional system prompt
+            system_prompt: Optional system prompt (a SystemPrompt is sent as one string)
             response_schema: Optional JSON schema for structured output
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
@@ -61,6 +70,24 @@ class OpenAIProvider(LLMProvider):
         Raises:
             Exception: If the API call fails
         """
+        # Handle structured output if schema provided
+        # OpenAI supports JSON mode; the schema itself goes in the system prompt
+        schema_instruction = ""
+        if response_schema:
+            schema_instruction = (
+                f"\n\nYou must respond with valid JSON matching this schema:\n"
+                f"{format_schema(response_schema)}"
+            )
+
+        if isinstance(system_prompt, SystemPrompt):
+            # OpenAI caches matching prompt prefixes automatically, so send one
+            # string with the schema kept in the static prefix
+            system_prompt = system_prompt.with_static_suffix(schema_instruction).as_string()
+        elif system_prompt:
+            system_prompt += schema_instruction
+        elif schema_instruction:
+            system_prompt = schema_instruction.strip()
+
         # Convert messages to OpenAI format
         openai_messages = []
 
@@ -86,28 +113,10 @@ class OpenAIProvider(LLMProvider):
             "temperature": temperature,
         }
 
-        # Handle structured output if schema provided
-        # OpenAI supports JSON mode and function calling
         if response_schema:
             # Use JSON mode for structured output
             request_params["response_format"] = {"type": "json_object"}
 
-            # Add schema instruction to the last message or system prompt
-            schema_instruction = (
-                f"\n\nYou must respond with valid JSON matching this schema:\n"
-                f"{json.dumps(response_schema, indent=2)}"
-            )
-
-            # Append to system message if it exists
-            if openai_messages and openai_messages[0]["role"] == "system":
-                openai_messages[0]["content"] += schema_instruction
-            else:
-                # Add as system message at the beginning
-                openai_messages.insert(0, {
-                    "role": "system",
-                    "content": schema_instruction.strip(),
-                })
-
         # Make API call
         try:
             response = await self.client.chat.completions.create(**request_params)
@@ -118,10 +127,17 @@ class OpenAIProvider(LLMProvider):
             # Build response object
             usage = None
             if response.usage:
+                # prompt_tokens includes cached tokens; report them separately
+                # so input_tokens means uncached input for every provider
+                details = response.usage.prompt_tokens_details
+                cached_tokens = (details.cached_tokens or 0) if details else 0
                 usage = {
-                    "input_tokens": response.usage.prompt_tokens,
+                    "input_tokens": response.usage.prompt_tokens - cached_tokens,
                     "output_tokens": response.usage.completion_tokens,
+                    "cache_read_input_tokens": cached_tokens,
+                    "cache_creation_input_tokens": 0,
                 }
+                record_usage(usage)
 
             return LLMResponse(
                 content=content.strip(),
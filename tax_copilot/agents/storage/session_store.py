@@ -2,19 +2,30 @@
 
 import os
 import json
+import hashlib
 import secrets
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-from tax_copilot.core.conversation import Session, ConversationState
+from tax_copilot.core.conversation import (
+    Session,
+    ConversationState,
+    ConversationMessage,
+    SessionSummary,
+)
 
 
 class SessionStore:
     """
     Manages persistent storage of interview sessions.
 
-    Sessions are stored as JSON files in ~/.tax_copilot/sessions/
+    Sessions are stored as JSON files in ~/.tax_copilot/sessions/. Messages
+    added after the last full save are appended to a per-session JSONL log
+    ({session_id}.messages.jsonl) and merged back in on load; the next full
+    save folds them into the JSON file and removes the log. A small
+    {session_id}.meta.json sidecar holds the session's listing fields, so
+    sessions can be listed without parsing their message histories.
     """
 
     def __init__(self, data_dir: str | None = None):
@@ -33,6 +44,9 @@ class SessionStore:
         self.sessions_dir = self.base_dir / "sessions"
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
 
+        # session_id -> (messages on disk, digest of everything but messages)
+        self._persisted: dict[str, tuple[int, str]] = {}
+
     def create_session(
         self,
         user_id: str,
@@ -108,6 +122,59 @@ class SessionStore:
                 temp_path.unlink()
             raise IOError(f"Failed to save session {session.session_id}: {e}") from e
 
+        # The full file now holds every message
+        self._message_log_path(session.session_id).unlink(missing_ok=True)
+        self._persisted[session.session_id] = (len(session.messages), _header_digest(session))
+        self._save_summary(session)
+
+    def save_session_changes(self, session: Session) -> None:
+        """
+        Persist changes made since the session was last saved or loaded.
+
+        If only new messages were added (the common case for an interview
+        turn), they are appended to the session's message log instead of
+        rewriting the whole file; any other change falls back to a full
+        save_session.
+
+        Args:
+            session: Session to save
+
+        Raises:
+            IOError: If save fails
+        """
+        persisted = self._persisted.get(session.session_id)
+        if (
+            persisted is None
+            or len(session.messages) < persisted[0]
+            or _header_digest(session) != persisted[1]
+        ):
+            self.save_session(session)
+            return
+
+        saved_count, header = persisted
+        if len(session.messages) == saved_count:
+            return
+
+        # Each line records its message index, so entries already folded into
+        # the JSON file (e.g. after an interrupted save) are skipped on load
+        lines = [
+            json.dumps({"index": index, **message.model_dump(mode="json")}) + "\n"
+            for index, message in enumerate(session.messages[saved_count:], start=saved_count)
+        ]
+        try:
+            with open(self._message_log_path(session.session_id), "a") as f:
+                f.writelines(lines)
+        except OSError as e:
+            raise IOError(f"Failed to save session {session.session_id}: {e}") from e
+
+        self._persisted[session.session_id] = (len(session.messages), header)
+
+        # Match what load_session reports once the log is merged back in, so
+        # listings sort by the latest activity (updated_at isn't in the digest)
+        if session.messages[-1].timestamp > session.updated_at:
+            session.updated_at = session.messages[-1].timestamp
+        self._save_summary(session)
+
     def load_session(self, session_id: str) -> Session:
         """
         Load session from disk.
@@ -143,7 +210,15 @@ class SessionStore:
             for msg in session_dict.get("messages", []):
                 msg["timestamp"] = datetime.fromisoformat(msg["timestamp"])
 
-            return Session(**session_dict)
+            session = Session(**session_dict)
+            if self._load_message_log(session):
+                self._persisted[session_id] = (len(session.messages), _header_digest(session))
+            else:
+                # The log ends in a torn line; appending after it would glue
+                # the next entry onto the fragment, so the next save is a
+                # full one that folds the messages in and removes the log
+                self._persisted.pop(session_id, None)
+            return session
 
         except json.JSONDecodeError as e:
             raise ValueError(f"Corrupted session file: {session_id}") from e
@@ -158,6 +233,9 @@ class SessionStore:
         """
         List all sessions, optionally filtered by user_id and/or tax_year.
 
+        Loads every matching session in full; use list_session_summaries when
+        only the listing fields are needed.
+
         Args:
             user_id: Filter by user ID
             tax_year: Filter by tax year
@@ -165,34 +243,60 @@ class SessionStore:
         Returns:
             List of Session objects, sorted by updated_at (newest first)
         """
-        print(f"User ID: {user_id}")
-        print(f"Tax year: {tax_year}")
-        print(f"Listing sessions in {self.sessions_dir}")
-        for session_file in self.sessions_dir.glob("sess_*.json"):
-            print(f"Session file: {session_file}")
-
         sessions = []
 
+        for summary in self.list_session_summaries(user_id=user_id, tax_year=tax_year):
+            try:
+                sessions.append(self.load_session(summary.session_id))
+            except Exception:
+                # Skip corrupted sessions
+                continue
+
+        return sessions
+
+    def list_session_summaries(
+        self,
+        user_id: str | None = None,
+        tax_year: int | None = None,
+    ) -> list[SessionSummary]:
+        """
+        List session summaries, optionally filtered by user_id and/or tax_year.
+
+        Reads each session's meta sidecar; sessions saved before sidecars
+        existed are loaded once and get one written.
+
+        Args:
+            user_id: Filter by user ID
+            tax_year: Filter by tax year
+
+        Returns:
+            List of SessionSummary objects, sorted by updated_at (newest first)
+        """
+        summaries = []
+
         for session_file in self.sessions_dir.glob("sess_*.json"):
+            if session_file.name.endswith(".meta.json"):
+                continue
+
             try:
-                session = self.load_session(session_file.stem)
+                summary = self.load_session_summary(session_file.stem)
 
                 # Apply filters
-                if user_id and session.user_id != user_id:
+                if user_id and summary.user_id != user_id:
                     continue
-                if tax_year and session.tax_year != tax_year:
+                if tax_year and summary.tax_year != tax_year:
                     continue
 
-                sessions.append(session)
+                summaries.append(summary)
 
             except Exception:
                 # Skip corrupted sessions
                 continue
 
         # Sort by updated_at, newest first
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+        summaries.sort(key=lambda s: s.updated_at, reverse=True)
 
-        return sessions
+        return summaries
 
     def delete_session(self, session_id: str) -> None:
         """
@@ -210,6 +314,9 @@ class SessionStore:
             raise FileNotFoundError(f"Session not found: {session_id}")
 
         session_path.unlink()
+        self._message_log_path(session_id).unlink(missing_ok=True)
+        self._summary_path(session_id).unlink(missing_ok=True)
+        self._persisted.pop(session_id, None)
 
     def session_exists(self, session_id: str) -> bool:
         """
@@ -223,3 +330,97 @@ class SessionStore:
         """
         session_path = self.sessions_dir / f"{session_id}.json"
         return session_path.exists()
+
+    def load_session_summary(self, session_id: str) -> SessionSummary:
+        """
+        Read a session's listing fields without loading its messages.
+
+        Sessions saved before sidecars existed are loaded once and get one
+        written.
+
+        Args:
+            session_id: ID of session
+
+        Returns:
+            SessionSummary
+
+        Raises:
+            FileNotFoundError: If session doesn't exist
+            ValueError: If the session file is corrupted
+        """
+        try:
+            return SessionSummary.model_validate_json(self._summary_path(session_id).read_bytes())
+        except (OSError, ValueError):
+            session = self.load_session(session_id)
+            self._save_summary(session)
+            return session.summary()
+
+    def _message_log_path(self, session_id: str) -> Path:
+        """Path of the append-only log of messages not yet in the session file."""
+        return self.sessions_dir / f"{session_id}.messages.jsonl"
+
+    def _summary_path(self, session_id: str) -> Path:
+        """Path of the sidecar file with the session's listing fields."""
+        return self.sessions_dir / f"{session_id}.meta.json"
+
+    def _save_summary(self, session: Session) -> None:
+        """
+        Write the session's meta sidecar using atomic write.
+
+        Args:
+            session: Session that was just saved
+
+        Raises:
+            IOError: If save fails
+        """
+        summary_path = self._summary_path(session.session_id)
+        temp_path = summary_path.with_suffix(".tmp")
+
+        try:
+            temp_path.write_text(session.summary().model_dump_json())
+            temp_path.replace(summary_path)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            raise IOError(f"Failed to save session {session.session_id}: {e}") from e
+
+    def _load_message_log(self, session: Session) -> bool:
+        """
+        Append messages from the session's message log, if any.
+
+        Args:
+            session: Session loaded from its JSON file (modified in place)
+
+        Returns:
+            False if the log ends in a line that can't be read (e.g. a
+            partially written entry), True otherwise
+        """
+        log_path = self._message_log_path(session.session_id)
+        try:
+            with open(log_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return True
+
+        intact = True
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                index = entry.pop("index")
+                message = ConversationMessage.model_validate(entry)
+            except (ValueError, KeyError):
+                # Partially written last line
+                intact = False
+                break
+            if index == len(session.messages):
+                session.messages.append(message)
+
+        if session.messages and session.messages[-1].timestamp > session.updated_at:
+            session.updated_at = session.messages[-1].timestamp
+
+        return intact
+
+
+def _header_digest(session: Session) -> str:
+    """Digest of every session field except messages and updated_at."""
+    header_json = session.model_dump_json(exclude={"messages", "updated_at"})
+    return hashlib.blake2b(header_json.encode(), digest_size=16).hexdigest()
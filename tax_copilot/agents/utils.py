@@ -2,7 +2,20 @@
 
 import json
 import re
-from typing import Any
+from typing import Any, Iterable
+
+from pydantic_core import from_json
+
+# Markdown code fences around a JSON response: ```json ... ```, ~~~json ... ~~~,
+# and the single-line form ```json {...}```
+_CODE_FENCE_PATTERN = re.compile(r'^```(?:json|JSON)?\s*\n(.*?)\n```$', re.DOTALL)
+_TILDE_FENCE_PATTERN = re.compile(r'^~~~(?:json|JSON)?\s*\n(.*?)\n~~~$', re.DOTALL)
+_SINGLE_LINE_FENCE_PATTERN = re.compile(r'^```(?:json|JSON)?\s*(.*?)\s*```$', re.DOTALL)
+
+# Thousands separator inside a number (891,450 or 1,234,567): a comma between
+# a digit and exactly three more digits. Also matches minified arrays like
+# [100,200], so it is only applied to responses that aren't valid JSON
+_THOUSANDS_SEPARATOR_PATTERN = re.compile(r'(?<=\d),(?=\d{3}(?!\d))')
 
 
 def parse_json_response(response_text: str) -> dict[str, Any]:
@@ -30,38 +43,43 @@ def parse_json_response(response_text: str) -> dict[str, Any]:
 
     # Remove markdown code fences
     # Handles: ```json, ```JSON, ```, ~~~json, ~~~, etc.
-    # Pattern: optional fence (``` or ~~~) + optional language + newline + content + optional fence
-    code_fence_pattern = r'^```(?:json|JSON)?\s*\n(.*?)\n```$'
-    match = re.search(code_fence_pattern, text, re.DOTALL)
+    match = _CODE_FENCE_PATTERN.search(text)
 
     if match:
         # Extract JSON content from code fence
         text = match.group(1).strip()
     else:
         # Try alternative fence style (~~~ instead of ```)
-        code_fence_pattern = r'^~~~(?:json|JSON)?\s*\n(.*?)\n~~~$'
-        match = re.search(code_fence_pattern, text, re.DOTALL)
+        match = _TILDE_FENCE_PATTERN.search(text)
         if match:
             text = match.group(1).strip()
         else:
             # Try single-line code fence: ```json ... ```
-            single_line_pattern = r'^```(?:json|JSON)?\s*(.*?)\s*```$'
-            match = re.search(single_line_pattern, text, re.DOTALL)
+            match = _SINGLE_LINE_FENCE_PATTERN.search(text)
             if match:
                 text = match.group(1).strip()
 
     # Additional cleanup: remove any leading/trailing backticks or markdown
     text = text.strip('`').strip()
 
-    # Remove commas from numbers (LLMs often format numbers like 891,450)
-    # This regex finds numbers with commas and removes the commas
-    # Pattern: digit(s), comma, digit(s) - can repeat multiple times
-    text = re.sub(r'(\d+),(\d+)', r'\1\2', text)
-    # Need to apply multiple times for numbers like 1,234,567
-    while ',\d' in text:
-        text = re.sub(r'(\d+),(\d+)', r'\1\2', text)
+    # Parse JSON with pydantic's native parser; valid JSON is returned as-is
+    try:
+        return from_json(text)
+    except ValueError:
+        pass
+
+    # Invalid JSON: LLMs sometimes write numbers with thousands separators
+    # (891,450 or 1,234,567). Remove commas followed by exactly three digits
+    # and retry. This is only safe on JSON that failed to parse; in valid
+    # minified JSON the same pattern also matches array separators, as in
+    # [100,200]. On failure, re-parse with the stdlib to raise a
+    # JSONDecodeError with position information
+    text = _THOUSANDS_SEPARATOR_PATTERN.sub('', text)
+    try:
+        return from_json(text)
+    except ValueError:
+        pass
 
-    # Parse JSON
     try:
         return json.loads(text)
     except json.JSONDecodeError as e:
@@ -90,3 +108,81 @@ def safe_parse_json(response_text: str, fallback: dict[str, Any] | None = None)
     except json.JSONDecodeError as e:
         print(f"JSON parsing failed: {e}")
         return fallback if fallback is not None else {}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of LLM tokens in a text.
+
+    Uses the common ~4 characters per token heuristic, which is close enough
+    for threshold checks without a tokenizer dependency.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4
+
+
+def is_truncated_json(text: str) -> bool:
+    """
+    Check whether a JSON object response was cut off before its closing brace.
+
+    Used to retry with a larger max_tokens budget when a tight one was hit.
+
+    Args:
+        text: Raw response text (may be wrapped in a code fence)
+
+    Returns:
+        True if the response doesn't end with a closing brace
+    """
+    return not text.strip().strip("`~").strip().endswith("}")
+
+
+def as_float(value: Any, default: float = 0.0) -> float:
+    """
+    Read a number from LLM output that may be missing or malformed.
+
+    Args:
+        value: Raw value from parsed JSON (number, numeric string, None, ...)
+        default: Value to return if it cannot be converted
+
+    Returns:
+        Value as a float, or default
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def as_str_list(value: Any) -> list[str]:
+    """
+    Read a list of strings from LLM output that may be missing or malformed.
+
+    Args:
+        value: Raw value from parsed JSON
+
+    Returns:
+        Non-empty items converted to strings, or an empty list
+    """
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value if item]
+
+
+def as_choice(value: Any, choices: Iterable[str], default: str) -> str:
+    """
+    Read an enum-like string from LLM output, falling back to a default.
+
+    Args:
+        value: Raw value from parsed JSON
+        choices: Allowed values
+        default: Value to return if value is not one of choices
+
+    Returns:
+        value if it is allowed, otherwise default
+    """
+    return value if value in choices else default
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -30,9 +35,33 @@ def _load_profile(path: str) -> TaxProfile:
         raise click.ClickException(f"Failed to parse TaxProfile JSON at {path}: {e!r}")
 
 
+def _configure_logging() -> None:
+    """
+    Send tax_copilot progress logs to stderr from a background thread.
+
+    Records are queued by the caller and written by a QueueListener, so the
+    event loop never blocks on terminal I/O.
+    """
+    app_logger = logging.getLogger("tax_copilot")
+    if app_logger.handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.setLevel(logging.INFO)
+    app_logger.propagate = False
+
+
 @click.group()
 def cli() -> None:
     """tax-copilot CLI."""
+    _configure_logging()
 
 
 @cli.command()
@@ -183,7 +212,7 @@ async def _run_precheck(
 
     # Handle --list flag
     if list_sessions:
-        sessions = storage.list_sessions(user_id=user, tax_year=year)
+        sessions = storage.list_session_summaries(user_id=user, tax_year=year)
 
         if not sessions:
             filter_msg = ""
@@ -201,7 +230,7 @@ async def _run_precheck(
             click.echo(f"  Tax Year: {sess.tax_year}")
             click.echo(f"  State: {sess.state.value}")
             click.echo(f"  Updated: {sess.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            click.echo(f"  Messages: {len(sess.messages)}")
+            click.echo(f"  Messages: {sess.messages_count}")
             click.echo()
 
         return
@@ -521,7 +550,7 @@ async def _run_analyze(
 
         # Save report if requested
         if save:
-            report_path = advisor.save_report(
+            report_path = await advisor.save_report(
                 report, user_id=getattr(profile, "user_id", "unknown")
             )
             click.echo(f"\nReport saved to: {report_path}\n")
@@ -562,7 +591,7 @@ def reports(user: Optional[str], report_id: Optional[str], output_format: str) -
         tax-copilot reports --user john
 
     View specific report:
-        tax-copilot reports --report-id rpt_20240115_abc123
+        tax-copilot reports --report-id rpt_1811a2b3c4d5e6f7_a1b2c3
 
     View report as JSON:
         tax-copilot reports --report-id rpt_xxx --format json
@@ -599,7 +628,7 @@ async def _run_reports(
     # View specific report
     if report_id:
         try:
-            report = advisor.load_report(report_id)
+            report = await advisor.load_report(report_id)
 
             if output_format == "json":
                 click.echo(advisor.report_generator.to_json(report))
@@ -684,19 +713,12 @@ async def _run_reports(
                 except:
                     click.echo(f"  Generated: {summary['generated_at']}")
 
-            # Format total_tax and potential_savings
-            if isinstance(summary.get("total_tax"), dict):
-                total_tax_cents = summary["total_tax"].get("cents", 0)
-            else:
-                total_tax_cents = summary.get("total_tax", 0)
-
-            if isinstance(summary.get("potential_savings"), dict):
-                savings_cents = summary["potential_savings"].get("cents", 0)
-            else:
-                savings_cents = summary.get("potential_savings", 0)
+            # Summaries store Money values as {"dollars": ...}
+            total_tax_dollars = summary["total_tax"]["dollars"]
+            savings_dollars = summary["potential_savings"]["dollars"]
 
-            click.echo(f"  Total Tax: ${total_tax_cents / 100:,.2f}")
-            click.echo(f"  Potential Savings: ${savings_cents / 100:,.2f}")
+            click.echo(f"  Total Tax: ${total_tax_dollars:,.2f}")
+            click.echo(f"  Potential Savings: ${savings_dollars:,.2f}")
             click.echo()
 
 
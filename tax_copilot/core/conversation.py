@@ -27,6 +27,21 @@ class ConversationMessage(BaseModel):
     metadata: dict[str, Any] | None = None
 
 
+class SessionSummary(BaseModel):
+    """Session fields needed to list or resume sessions, without messages or data."""
+
+    session_id: str
+    user_id: str
+    tax_year: int
+    state: ConversationState
+    created_at: datetime
+    updated_at: datetime
+    messages_count: int
+    last_agent_message: str | None
+    topics_covered: list[str] = Field(default_factory=list)
+    topics_remaining: list[str] = Field(default_factory=list)
+
+
 class Session(BaseModel):
     """
     Represents a tax interview session.
@@ -96,6 +111,37 @@ class Session(BaseModel):
             self.topics_remaining.remove(topic)
         self.updated_at = datetime.now()
 
+    def summary(self) -> SessionSummary:
+        """Get the listing fields of this session."""
+        return SessionSummary(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            tax_year=self.tax_year,
+            state=self.state,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            messages_count=len(self.messages),
+            last_agent_message=next(
+                (msg.content for msg in reversed(self.messages) if msg.role == "agent"),
+                None,
+            ),
+            topics_covered=list(self.topics_covered),
+            topics_remaining=list(self.topics_remaining),
+        )
+
     def get_recent_messages(self, count: int = 10) -> list[ConversationMessage]:
         """Get the most recent N messages."""
         return self.messages[-count:] if self.messages else []
+
+    def get_llm_history(self, count: int = 10) -> list[tuple[Literal["user", "assistant"], str]]:
+        """
+        Get the most recent N user/agent messages as LLM chat turns.
+
+        System messages are skipped and agent messages map to the
+        "assistant" role.
+        """
+        return [
+            ("user" if msg.role == "user" else "assistant", msg.content)
+            for msg in self.messages[-count:]
+            if msg.role != "system"
+        ]
@@ -85,6 +85,36 @@ class TaxProfile(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def to_prompt_dict(self) -> Dict[str, Any]:
+        """Compact, flattened view of the profile for embedding in LLM prompts.
+
+        Metadata and empty/zero fields are dropped, money is rounded to whole
+        dollars and dependent ages are joined into a CSV string.
+        """
+        fields: Dict[str, Any] = {
+            "tax_year": self.tax_year,
+            "filing_status": self.filing_status,
+            "state": self.state,
+            "total_income": self.income.total_income,
+            "w2_count": self.income.w2_count,
+            "ira_contribution": self.income.ira_contribution,
+            "student_loan_interest": self.deductions.student_loan_interest,
+            "itemized": self.deductions.itemized,
+            "itemized_total": self.deductions.itemized_total,
+            "dependents": self.dependents.count,
+            "dependent_ages": ",".join(str(age) for age in self.dependents.ages),
+            "claiming_child_tax_credit": self.dependents.claiming_child_tax_credit,
+        }
+
+        compact: Dict[str, Any] = {}
+        for key, value in fields.items():
+            if isinstance(value, Money):
+                value = round(value.dollars)
+            if value is None or value == "" or value is False or value == 0:
+                continue
+            compact[key] = value
+        return compact
+
 
 class Finding(BaseModel):
     rule_id: str